@@ -1,189 +1,777 @@
-from estrutura import Estado, Problema
-from collections import deque
+from estrutura import CODIGO_ACAO, Estado, Problema, Solucao, somente_resolvivel
+from filas import FilaBaldes
+# Buscas decoradas aceitam max_nos / max_memoria_mb e param com um OrcamentoExcedido
+from orcamento import com_orcamento, orcamento_ativo, OrcamentoExcedido
+from collections import OrderedDict, deque
+from itertools import count
+from time import perf_counter
 import heapq
  
-def buscaEmLargura(problema):
-    """Implementação do algoritmo de busca em largura (BFS)"""
-    if problema.estadoObjetivo(problema.estadoInicial):
-        return [problema.estadoInicial]
+@com_orcamento
+@somente_resolvivel
+def buscaEmLargura(problema, bidirecional=False, estatisticas=None, compacta=False):
+    """Implementação do algoritmo de busca em largura (BFS)
+    
+    Com `bidirecional=True`, delega para `buscaBidirecional`. Um objeto
+    `estatisticas.Estatisticas` opcional recebe contadores e tempos da busca
+    (só na busca comum: as variantes bidirecional e compacta não os coletam).
+    Com `compacta=True`, a busca não cria nós e retorna uma `Solucao` (ver `_largura_compacta`).
+    """
+    if bidirecional:
+        if estatisticas is not None:
+            raise ValueError("A busca bidirecional não coleta estatísticas")
+        return buscaBidirecional(problema)
+    if compacta:
+        if estatisticas is not None:
+            raise ValueError("A busca compacta não coleta estatísticas")
+        return _largura_compacta(problema)
     
-    fronteira = deque([problema.estadoInicial])
     explorados = set()
+    solucao = None
+    try:
+        if problema.estadoObjetivo(problema.estadoInicial):
+            solucao = [problema.estadoInicial]
+            return solucao
+        
+        fronteira = deque([problema.estadoInicial])
+        
+        # Operações do laço; com estatísticas, são trocadas por versões medidas
+        sucessores, inserir, retirar = problema.funcaoSucessora, fronteira.append, fronteira.popleft
+        if estatisticas is not None:
+            sucessores, inserir, retirar = estatisticas.instrumentar(fronteira, sucessores, inserir, retirar)
+        
+        while fronteira:
+            estado = retirar()
+            
+            # O tabuleiro compactado (inteiro) identifica o estado nos conjuntos de explorados
+            chave_estado = estado.tabuleiro
+            if chave_estado in explorados:
+                continue
+            
+            explorados.add(chave_estado)
+            
+            for estado_filho in sucessores(estado):
+                if problema.estadoObjetivo(estado_filho):
+                    solucao = problema.solucao(estado_filho)
+                    return solucao
+                
+                # Usar o tabuleiro compactado para verificação de estados já visitados
+                chave_filho = estado_filho.tabuleiro
+                if chave_filho not in explorados:
+                    inserir(estado_filho)
+        
+        return None  # Não encontrou solução
+    finally:
+        if estatisticas is not None:
+            estatisticas.finalizar(len(explorados), solucao)
+ 
+ 
+def _movimentos_codificados(problema):
+    """Para cada posição do vazio, pares (código de 2 bits da ação, nova posição do vazio)"""
+    return [[(CODIGO_ACAO[acao], posicao) for acao, posicao in acoes] for acoes in problema._movimentos]
+ 
+ 
+def _largura_compacta(problema):
+    """Busca em largura só com tabuleiros compactados e uma tabela lateral de pais
+    
+    Cada estado alcançado ocupa uma entrada tabuleiro -> vazio << 2 | código do
+    movimento que chegou nele (ver `Problema.reconstruir`), um inteiro pequeno
+    que o Python não aloca; a fronteira só referencia os tabuleiros já guardados.
+    Os estados da solução só são criados ao serem lidos. Os limites de
+    `com_orcamento` valem como na busca comum.
+    """
+    inicial = problema.estadoInicial
+    if problema.estadoObjetivo(inicial):
+        return Solucao(inicial)
+    
+    objetivo = problema._tabuleiro_objetivo
+    movimentos = _movimentos_codificados(problema)
+    bits = problema._bits
+    mascara = problema._mascara
+    
+    orcamento = orcamento_ativo(problema)
+    
+    registros = {inicial.tabuleiro: inicial.vazio << 2}  # o código do inicial não é lido
+    fronteira = deque([inicial.tabuleiro])
     
     while fronteira:
-        estado = fronteira.popleft()
+        tabuleiro = fronteira.popleft()
+        vazio = registros[tabuleiro] >> 2
+        if orcamento is not None:
+            orcamento.expandir(len(movimentos[vazio]))
+        deslocamento_zero = bits * vazio
+        for codigo, posicao in movimentos[vazio]:
+            deslocamento = bits * posicao
+            peca = (tabuleiro >> deslocamento) & mascara
+            novo_tabuleiro = tabuleiro - (peca << deslocamento) + (peca << deslocamento_zero)
+            if novo_tabuleiro in registros:
+                continue
+            
+            registros[novo_tabuleiro] = posicao << 2 | codigo
+            if novo_tabuleiro == objetivo:
+                return problema.reconstruir(registros, novo_tabuleiro, posicao)
+            fronteira.append(novo_tabuleiro)
+    
+    return None  # Não encontrou solução
+ 
+ 
+@com_orcamento
+@somente_resolvivel
+def buscaBidirecional(problema):
+    """Implementação da busca em largura bidirecional
+    
+    Expande, uma camada inteira por vez, a partir do estado inicial e do objetivo,
+    sempre pelo lado de fronteira menor. Quando as buscas se encontram, o melhor
+    encontro da camada dá o caminho mais curto, com ~b^(d/2) nós em cada lado.
+    """
+    inicial = problema.estadoInicial
+    if problema.estadoObjetivo(inicial):
+        return [inicial]
+    
+    objetivo = problema._objetivo
+    # Estados alcançados em cada sentido: tabuleiro compactado -> nó (com o caminho até a origem)
+    alcancados_frente = {inicial.tabuleiro: inicial}
+    alcancados_tras = {objetivo.tabuleiro: objetivo}
+    fronteira_frente = [inicial]
+    fronteira_tras = [objetivo]
+    
+    while fronteira_frente and fronteira_tras:
+        # Expandir o lado com a fronteira menor
+        frente = len(fronteira_frente) <= len(fronteira_tras)
+        if frente:
+            fronteira, alcancados, outros = fronteira_frente, alcancados_frente, alcancados_tras
+        else:
+            fronteira, alcancados, outros = fronteira_tras, alcancados_tras, alcancados_frente
         
-        # Converter o estado para uma representação hashable para checar se já foi explorado
-        estado_str = str(estado.vetor)
-        if estado_str in explorados:
-            continue
+        proxima = []
+        encontro = None  # (custo total, nó do lado inicial, nó do lado objetivo)
+        for estado in fronteira:
+            for estado_filho in problema.funcaoSucessora(estado):
+                chave_filho = estado_filho.tabuleiro
+                if chave_filho in alcancados:
+                    continue
+                
+                outro = outros.get(chave_filho)
+                if outro is not None:
+                    # Os lados se encontraram; terminar a camada guardando o menor custo total
+                    custo = estado_filho.custo + outro.custo
+                    if encontro is None or custo < encontro[0]:
+                        encontro = (custo, estado_filho, outro) if frente else (custo, outro, estado_filho)
+                    continue
+                
+                alcancados[chave_filho] = estado_filho
+                proxima.append(estado_filho)
         
-        explorados.add(estado_str)
+        if encontro is not None:
+            _, estado, ponte = encontro
+            # Seguir a cadeia do lado do objetivo, recriando cada passo a partir do lado inicial
+            while ponte.pai is not None:
+                ponte = ponte.pai
+                acao = next(acao for acao, posicao in problema._movimentos[estado.vazio]
+                            if posicao == ponte.vazio)
+                estado = Estado.filho(estado, ponte.tabuleiro, ponte.vazio, acao)
+            return problema.solucao(estado)
         
-        for estado_filho in problema.funcaoSucessora(estado):
-            if problema.estadoObjetivo(estado_filho):
-                return problema.solucao(estado_filho)
-            
-            # Usar representação em string para verificação de estados já visitados
-            filho_str = str(estado_filho.vetor)
-            if filho_str not in explorados:
-                fronteira.append(estado_filho)
+        if frente:
+            fronteira_frente = proxima
+        else:
+            fronteira_tras = proxima
     
     return None  # Não encontrou solução
  
  
-def buscaEmProfundidade(problema, limite_profundidade=100):
-    """Implementação do algoritmo de busca em profundidade (DFS) com limite de profundidade"""
-    if problema.estadoObjetivo(problema.estadoInicial):
-        return [problema.estadoInicial]
+@com_orcamento
+@somente_resolvivel
+def buscaEmProfundidade(problema, limite_profundidade=100, estatisticas=None, iterativo=False):
+    """Implementação do algoritmo de busca em profundidade (DFS) com limite de profundidade
     
-    # Usando uma pilha para implementar a busca em profundidade
-    fronteira = [problema.estadoInicial]
-    explorados = set()
+    Com `iterativo=True`, delega para `buscaAprofundamentoIterativo` (ótima, memória O(profundidade)),
+    que segue contando nos limites desta chamada mas não coleta estatísticas.
+    """
+    if iterativo:
+        if estatisticas is not None:
+            raise ValueError("O aprofundamento iterativo não coleta estatísticas")
+        return buscaAprofundamentoIterativo(problema, limite_maximo=limite_profundidade)
     
-    while fronteira:
-        estado = fronteira.pop()  # Remove o último elemento (comportamento de pilha)
+    explorados = set()
+    solucao = None
+    try:
+        if problema.estadoObjetivo(problema.estadoInicial):
+            solucao = [problema.estadoInicial]
+            return solucao
         
-        # Verificar se estamos ultrapassando o limite de profundidade
-        if estado.custo >= limite_profundidade:
-            continue
+        # Usando uma pilha para implementar a busca em profundidade
+        fronteira = [problema.estadoInicial]
         
-        # Converter o estado para uma representação hashable para checar se já foi explorado
-        estado_str = str(estado.vetor)
-        if estado_str in explorados:
-            continue
+        # Operações do laço; com estatísticas, são trocadas por versões medidas
+        sucessores, inserir, retirar = problema.funcaoSucessora, fronteira.append, fronteira.pop
+        if estatisticas is not None:
+            sucessores, inserir, retirar = estatisticas.instrumentar(fronteira, sucessores, inserir, retirar)
+        
+        while fronteira:
+            estado = retirar()  # Remove o último elemento (comportamento de pilha)
+            
+            # Verificar se estamos ultrapassando o limite de profundidade
+            if estado.custo >= limite_profundidade:
+                continue
+            
+            # O tabuleiro compactado (inteiro) identifica o estado nos conjuntos de explorados
+            chave_estado = estado.tabuleiro
+            if chave_estado in explorados:
+                continue
+            
+            explorados.add(chave_estado)
+            
+            # Expandir o estado atual
+            vizinhos = sucessores(estado)
+            # Inverter a ordem dos sucessores para manter a preferência de movimento
+            vizinhos.reverse()
+            
+            for estado_filho in vizinhos:
+                if problema.estadoObjetivo(estado_filho):
+                    solucao = problema.solucao(estado_filho)
+                    return solucao
+                
+                # Usar o tabuleiro compactado para verificação de estados já visitados
+                chave_filho = estado_filho.tabuleiro
+                if chave_filho not in explorados:
+                    inserir(estado_filho)
         
-        explorados.add(estado_str)
+        return None  # Não encontrou solução
+    finally:
+        if estatisticas is not None:
+            estatisticas.finalizar(len(explorados), solucao)
+ 
+ 
+def _profundidade_limitada(problema, limite, tamanho_tabela=0):
+    """DFS até `limite` movimentos sobre o tabuleiro compactado
+    
+    Retorna (ações até o objetivo ou None, se algum ramo foi cortado pelo limite).
+    Ciclos são evitados só em relação ao caminho atual; com `tamanho_tabela` > 0,
+    uma tabela de transposição (no máximo esse número de estados, descartando os
+    mais antigos) poda estados já visitados nesta iteração com folga igual ou maior.
+    """
+    inicial = problema.estadoInicial
+    objetivo = problema._tabuleiro_objetivo
+    movimentos = problema._movimentos
+    bits = problema._bits
+    mascara = problema._mascara
+    tabela = OrderedDict() if tamanho_tabela > 0 else None  # ordem de inserção, para descartar a mais antiga
+    orcamento = orcamento_ativo(problema)
+    
+    acoes = []
+    no_caminho = {inicial.tabuleiro}
+    cortou = False
+    
+    def busca(tabuleiro, vazio, restante):
+        nonlocal cortou
+        if tabuleiro == objetivo:
+            return True
+        if restante == 0:
+            cortou = True
+            return False
         
-        # Expandir o estado atual
-        sucessores = problema.funcaoSucessora(estado)
-        # Inverter a ordem dos sucessores para manter a preferência de movimento
-        sucessores.reverse()
+        if tabela is not None:
+            # Já explorado nesta iteração com pelo menos a mesma folga: não há o que achar aqui
+            folga = tabela.get(tabuleiro)
+            if folga is not None and folga >= restante:
+                return False
+            if folga is None and len(tabela) >= tamanho_tabela:
+                tabela.popitem(last=False)
+            tabela[tabuleiro] = restante
         
-        for estado_filho in sucessores:
-            if problema.estadoObjetivo(estado_filho):
-                return problema.solucao(estado_filho)
+        if orcamento is not None:
+            orcamento.expandir(len(movimentos[vazio]))
+        deslocamento_zero = bits * vazio
+        for acao, posicao in movimentos[vazio]:
+            deslocamento = bits * posicao
+            peca = (tabuleiro >> deslocamento) & mascara
+            novo_tabuleiro = tabuleiro - (peca << deslocamento) + (peca << deslocamento_zero)
+            if novo_tabuleiro in no_caminho:
+                continue
             
-            # Usar representação em string para verificação de estados já visitados
-            filho_str = str(estado_filho.vetor)
-            if filho_str not in explorados:
-                fronteira.append(estado_filho)
+            no_caminho.add(novo_tabuleiro)
+            acoes.append(acao)
+            if busca(novo_tabuleiro, posicao, restante - 1):
+                return True
+            acoes.pop()
+            no_caminho.remove(novo_tabuleiro)
+        return False
     
-    return None  # Não encontrou solução
+    if busca(inicial.tabuleiro, inicial.vazio, limite):
+        return acoes, cortou
+    return None, cortou
  
  
-def buscaGulosa(problema):
-    """Implementação do algoritmo de busca gulosa (Greedy Best-First Search)"""
+@com_orcamento
+@somente_resolvivel
+def buscaProfundidadeLimitada(problema, limite, tamanho_tabela=0):
+    """Implementação da busca em profundidade limitada, com memória proporcional ao limite
     
-    class EstadoPrioritario:
-        def __init__(self, estado, prioridade):
-            self.estado = estado
-            self.prioridade = prioridade
-        
-        def __lt__(self, outro):
-            return self.prioridade < outro.prioridade
+    Não é ótima: retorna o primeiro caminho de até `limite` movimentos encontrado.
+    """
+    acoes, _ = _profundidade_limitada(problema, limite, tamanho_tabela)
+    return Solucao.de_acoes(problema.estadoInicial, acoes) if acoes is not None else None
+ 
+ 
+@com_orcamento
+@somente_resolvivel
+def buscaAprofundamentoIterativo(problema, limite_maximo=None, tamanho_tabela=0):
+    """Implementação da busca em profundidade com aprofundamento iterativo (IDDFS)
     
-    # Verificar se o estado inicial já é o objetivo
-    if problema.estadoObjetivo(problema.estadoInicial):
-        return [problema.estadoInicial]
+    Repete a busca limitada com limites 0, 1, 2, ...: a primeira solução tem o
+    comprimento mínimo, como na busca em largura, e a memória é O(profundidade)
+    (mais a tabela de transposição, se `tamanho_tabela` > 0).
+    """
+    limite = 0
+    while limite_maximo is None or limite <= limite_maximo:
+        acoes, cortou = _profundidade_limitada(problema, limite, tamanho_tabela)
+        if acoes is not None:
+            return Solucao.de_acoes(problema.estadoInicial, acoes)
+        if not cortou:
+            return None  # Todo o espaço alcançável cabe no limite e não há solução
+        limite += 1
     
-    # Fronteira: fila de prioridade (apenas heurística, sem considerar o custo)
-    fronteira = []
-    heapq.heappush(fronteira, EstadoPrioritario(problema.estadoInicial,
-                                               problema.heuristica_manhattan(problema.estadoInicial)))
+    return None  # Não encontrou solução dentro do limite máximo
+ 
+ 
+@com_orcamento
+@somente_resolvivel
+def buscaGulosa(problema, heuristica=None, estatisticas=None, fila=FilaBaldes):
+    """Implementação do algoritmo de busca gulosa (Greedy Best-First Search)
+    
+    `heuristica` recebe um estado e estima sua distância ao objetivo; por padrão,
+    a distância de Manhattan (ver também `heuristica_conflito_linear` e `padroes.BancoPadroes`).
+    Um objeto `estatisticas.Estatisticas` opcional recebe contadores e tempos da busca.
+    `fila` é a classe da fronteira (`filas.FilaHeap` para heurísticas não inteiras).
+    """
+    if heuristica is None:
+        heuristica = problema.heuristica_manhattan
     
-    # Manter controle dos estados já explorados
     explorados = set()
+    solucao = None
+    try:
+        # Verificar se o estado inicial já é o objetivo
+        if problema.estadoObjetivo(problema.estadoInicial):
+            solucao = [problema.estadoInicial]
+            return solucao
+        
+        # Fronteira: fila de prioridade (apenas heurística, sem considerar o custo)
+        fronteira = fila()
+        
+        # Operações do laço; com estatísticas, são trocadas por versões medidas
+        sucessores, inserir, retirar = problema.funcaoSucessora, fronteira.inserir, fronteira.retirar
+        if estatisticas is not None:
+            sucessores, inserir, retirar = estatisticas.instrumentar(fronteira, sucessores, inserir, retirar)
+            heuristica = estatisticas.heuristica(heuristica)
+        
+        inicial = problema.no_inicial()
+        inserir(inicial.tabuleiro, inicial, heuristica(inicial))
+        
+        while fronteira:
+            # Pegar o estado com menor valor de heurística
+            estado = retirar()
+            
+            # Verificar se é o objetivo
+            if problema.estadoObjetivo(estado):
+                solucao = problema.solucao(estado)
+                return solucao
+            
+            # Marcar como explorado (a fila só devolve cada tabuleiro uma vez enquanto ele está nela)
+            explorados.add(estado.tabuleiro)
+            
+            # Expandir o estado
+            for estado_filho in sucessores(estado):
+                chave_filho = estado_filho.tabuleiro
+                
+                # A heurística não depende do caminho: estados já explorados ou na fronteira não mudam
+                if chave_filho in explorados or chave_filho in fronteira:
+                    continue
+                
+                # Adicionar à fronteira com prioridade = heurística (sem considerar o custo)
+                inserir(chave_filho, estado_filho, heuristica(estado_filho))
+        
+        return None  # Não encontrou solução
+    finally:
+        if estatisticas is not None:
+            estatisticas.finalizar(len(explorados), solucao)
+ 
+ 
+@com_orcamento
+@somente_resolvivel
+def a_estrela(problema, heuristica=None, estatisticas=None, fila=FilaBaldes, compacta=False):
+    """Implementação do algoritmo A* para busca informada
     
-    while fronteira:
-        # Pegar o estado com menor valor de heurística
-        estado_prioritario = heapq.heappop(fronteira)
-        estado = estado_prioritario.estado
+    `heuristica` recebe um estado e estima sua distância ao objetivo; por padrão,
+    a distância de Manhattan (ver também `heuristica_conflito_linear` e `padroes.BancoPadroes`).
+    Um objeto `estatisticas.Estatisticas` opcional recebe contadores e tempos da busca.
+    `fila` é a classe da fronteira (`filas.FilaHeap` para heurísticas não inteiras).
+    Com `compacta=True`, a busca não cria nós e retorna uma `Solucao` (ver `_a_estrela_compacta`).
+    """
+    if compacta:
+        if estatisticas is not None:
+            raise ValueError("A busca compacta não coleta estatísticas")
+        return _a_estrela_compacta(problema, heuristica, fila)
+    
+    if heuristica is None:
+        heuristica = problema.heuristica_manhattan
+    
+    # Fronteira: fila de prioridade (custo + heurística)
+    fronteira = fila()
+    # Menor custo conhecido de cada estado, na fronteira ou já explorado
+    custos = {}  # tabuleiro compactado -> custo
+    solucao = None
+    try:
+        # Verificar se o estado inicial já é o objetivo
+        if problema.estadoObjetivo(problema.estadoInicial):
+            solucao = [problema.estadoInicial]
+            return solucao
         
-        # Verificar se é o objetivo
-        if problema.estadoObjetivo(estado):
-            return problema.solucao(estado)
+        # Operações do laço; com estatísticas, são trocadas por versões medidas
+        sucessores, inserir, retirar = problema.funcaoSucessora, fronteira.inserir, fronteira.retirar
+        if estatisticas is not None:
+            sucessores, inserir, retirar = estatisticas.instrumentar(fronteira, sucessores, inserir, retirar)
+            heuristica = estatisticas.heuristica(heuristica)
         
-        # Converter para string para verificação
-        estado_str = str(estado.vetor)
+        inicial = problema.no_inicial()
+        inserir(inicial.tabuleiro, inicial, inicial.custo + heuristica(inicial))
+        custos[inicial.tabuleiro] = inicial.custo
         
-        # Pular se já exploramos esse estado
-        if estado_str in explorados:
-            continue
+        while fronteira:
+            # Pegar o estado com menor custo + heurística
+            estado = retirar()
+            
+            # Verificar se é o objetivo
+            if problema.estadoObjetivo(estado):
+                solucao = problema.solucao(estado)
+                return solucao
+            
+            # Expandir o estado
+            for estado_filho in sucessores(estado):
+                chave_filho = estado_filho.tabuleiro
+                
+                # Só interessa um caminho mais curto do que o já conhecido para este estado
+                custo_conhecido = custos.get(chave_filho)
+                if custo_conhecido is not None and custo_conhecido <= estado_filho.custo:
+                    continue
+                
+                # Adicionar (ou substituir, se já estava na fronteira) com prioridade = custo + heurística
+                custos[chave_filho] = estado_filho.custo
+                inserir(chave_filho, estado_filho, estado_filho.custo + heuristica(estado_filho))
+        
+        return None  # Não encontrou solução
+    finally:
+        if estatisticas is not None:
+            # Estados conhecidos fora da fronteira já saíram dela: os explorados, mais o objetivo encontrado
+            explorados = len(custos) - len(fronteira)
+            estatisticas.finalizar(explorados - 1 if solucao and len(solucao) > 1 else explorados, solucao)
+ 
+def _a_estrela_compacta(problema, heuristica=None, fila=FilaBaldes):
+    """A* só com tabuleiros compactados e uma tabela lateral de custos e pais
+    
+    Cada estado alcançado ocupa uma entrada tabuleiro -> custo << 2 | código do
+    movimento que chegou nele (ver `Problema.reconstruir`); a fronteira guarda
+    tuplas (tabuleiro, vazio, h). Sem `heuristica`, a distância de Manhattan é
+    atualizada só pela peça movida; uma heurística dada recebe um Estado
+    temporário, que não fica guardado. Os limites de `com_orcamento` valem
+    como na busca comum.
+    """
+    inicial = problema.estadoInicial
+    if problema.estadoObjetivo(inicial):
+        return Solucao(inicial)
+    
+    objetivo = problema._tabuleiro_objetivo
+    movimentos = _movimentos_codificados(problema)
+    bits = problema._bits
+    mascara = problema._mascara
+    manhattan = problema._manhattan
+    linhas, colunas = problema.linhas, problema.colunas
+    orcamento = orcamento_ativo(problema)
+    
+    h_inicial = heuristica(inicial) if heuristica is not None else problema.heuristica_manhattan(inicial)
+    registros = {inicial.tabuleiro: 0}  # tabuleiro -> custo << 2 | código do movimento
+    fronteira = fila()
+    inserir, retirar = fronteira.inserir, fronteira.retirar
+    inserir(inicial.tabuleiro, (inicial.tabuleiro, inicial.vazio, h_inicial), h_inicial)
+    
+    while fronteira:
+        tabuleiro, vazio, h = retirar()
+        if tabuleiro == objetivo:
+            return problema.reconstruir(registros, tabuleiro, vazio)
         
-        # Marcar como explorado
-        explorados.add(estado_str)
+        if orcamento is not None:
+            orcamento.expandir(len(movimentos[vazio]))
         
-        # Expandir o estado
-        for estado_filho in problema.funcaoSucessora(estado):
-            filho_str = str(estado_filho.vetor)
+        # A fila só devolve o item mais recente de cada tabuleiro, que tem o custo registrado
+        custo_filho = (registros[tabuleiro] >> 2) + 1
+        deslocamento_zero = bits * vazio
+        for codigo, posicao in movimentos[vazio]:
+            deslocamento = bits * posicao
+            peca = (tabuleiro >> deslocamento) & mascara
+            novo_tabuleiro = tabuleiro - (peca << deslocamento) + (peca << deslocamento_zero)
             
-            # Se já exploramos este estado, pular
-            if filho_str in explorados:
+            # Só interessa um caminho mais curto do que o já conhecido para este estado
+            registro = registros.get(novo_tabuleiro)
+            if registro is not None and registro >> 2 <= custo_filho:
                 continue
             
-            # Adicionar à fronteira com prioridade = heurística (sem considerar o custo)
-            heapq.heappush(fronteira, EstadoPrioritario(estado_filho,
-                                                      problema.heuristica_manhattan(estado_filho)))
+            if heuristica is None:
+                h_filho = h - manhattan[peca][posicao] + manhattan[peca][vazio]
+            else:
+                h_filho = heuristica(Estado(tabuleiro=novo_tabuleiro, vazio=posicao,
+                                            linhas=linhas, colunas=colunas))
+            registros[novo_tabuleiro] = custo_filho << 2 | codigo
+            inserir(novo_tabuleiro, (novo_tabuleiro, posicao, h_filho), custo_filho + h_filho)
     
     return None  # Não encontrou solução
  
  
-def a_estrela(problema):
-    """Implementação do algoritmo A* para busca informada"""
+@com_orcamento
+@somente_resolvivel
+def buscaFeixe(problema, largura=100, heuristica=None):
+    """Implementação da busca em feixe (beam search)
+    
+    Avança uma camada por vez, mantendo só os `largura` filhos de menor
+    heurística. A memória fica limitada a largura x profundidade, mas a busca
+    não é ótima e pode falhar (retorna None) quando o feixe descarta o caminho.
+    """
+    if heuristica is None:
+        heuristica = problema.heuristica_manhattan
+    
+    inicial = problema.no_inicial()
+    if problema.estadoObjetivo(inicial):
+        return [inicial]
     
-    class EstadoPrioritario:
-        def __init__(self, estado, prioridade):
-            self.estado = estado
-            self.prioridade = prioridade
+    camada = [inicial]
+    # Só os estados que passaram pelo feixe são lembrados
+    vistos = {inicial.tabuleiro}
+    
+    while camada:
+        candidatos = {}
+        for estado in camada:
+            for estado_filho in problema.funcaoSucessora(estado):
+                if problema.estadoObjetivo(estado_filho):
+                    return problema.solucao(estado_filho)
+                chave_filho = estado_filho.tabuleiro
+                if chave_filho not in vistos and chave_filho not in candidatos:
+                    candidatos[chave_filho] = estado_filho
         
-        def __lt__(self, outro):
-            return self.prioridade < outro.prioridade
+        camada = heapq.nsmallest(largura, candidatos.values(), key=heuristica)
+        vistos.update(estado.tabuleiro for estado in camada)
+    
+    return None  # O feixe esvaziou sem encontrar o objetivo
+ 
+ 
+class _NoSMA:
+    """Nó da árvore mantida pelo SMA*"""
+    __slots__ = ('estado', 'pai', 'f', 'filhos', 'novos', 'esquecidos', 'versao')
     
-    # Verificar se o estado inicial já é o objetivo
-    if problema.estadoObjetivo(problema.estadoInicial):
-        return [problema.estadoInicial]
+    def __init__(self, estado, pai, f):
+        self.estado = estado
+        self.pai = pai
+        self.f = f
+        self.filhos = []
+        self.novos = None       # sucessores ainda nunca gerados (None antes da primeira expansão)
+        self.esquecidos = []    # (f, estado) dos filhos removidos da memória
+        self.versao = 0
     
-    # Fronteira: fila de prioridade (custo + heurística)
-    fronteira = []
-    heapq.heappush(fronteira, EstadoPrioritario(problema.estadoInicial,
-                                               problema.estadoInicial.custo +
-                                               problema.heuristica_manhattan(problema.estadoInicial)))
+    def aberto(self):
+        """Ainda há sucessores fora da memória"""
+        return self.novos is None or bool(self.novos) or bool(self.esquecidos)
+ 
+ 
+@com_orcamento
+@somente_resolvivel
+def sma_estrela(problema, nos_memoria=10000, heuristica=None):
+    """Implementação do SMA* (A* simplificado com memória limitada)
     
-    # Manter controle dos estados já explorados e seus custos
-    explorados = {}  # estado_str -> custo
+    Mantém no máximo `nos_memoria` nós. Cada passo gera um único sucessor do
+    nó de menor f (o mais profundo, no empate); com a memória cheia, esquece a
+    folha de maior f (a mais rasa, no empate), guardando no pai o f dela para
+    quando o ramo for regenerado. Ótimo se a solução ótima couber na memória;
+    caso contrário, retorna um OrcamentoExcedido.
+    """
+    if heuristica is None:
+        heuristica = problema.heuristica_manhattan
     
-    while fronteira:
-        # Pegar o estado com menor custo + heurística
-        estado_prioritario = heapq.heappop(fronteira)
-        estado = estado_prioritario.estado
+    inicial = problema.no_inicial()
+    if problema.estadoObjetivo(inicial):
+        return [inicial]
+    
+    infinito = float('inf')
+    sequencia = count()
+    # Abertos por (f, -profundidade) e folhas por (-f, profundidade); entradas de
+    # versões antigas de um nó são ignoradas
+    abertos = []
+    folhas = []
+    
+    def atualizar(no):
+        """Registra o f e a situação atual do nó nas duas filas"""
+        no.versao += 1
+        if no.aberto():
+            heapq.heappush(abertos, (no.f, -no.estado.custo, next(sequencia), no.versao, no))
+        if not no.filhos and no.pai is not None:
+            heapq.heappush(folhas, (-no.f, no.estado.custo, next(sequencia), no.versao, no))
+    
+    def propagar(no):
+        """Nós com todos os sucessores já gerados ao menos uma vez ficam com o menor f deles"""
+        while no is not None and no.novos == []:
+            valores = [filho.f for filho in no.filhos] + [f for f, _ in no.esquecidos]
+            novo_f = min(valores) if valores else infinito
+            if novo_f == no.f:
+                break
+            no.f = novo_f
+            atualizar(no)
+            no = no.pai
+    
+    def esquecer(protegido):
+        """Remove da memória a pior folha (exceto `protegido`); retorna False se não houver nenhuma"""
+        while folhas:
+            _, _, _, versao, no = heapq.heappop(folhas)
+            if versao != no.versao or no.filhos or no is protegido:
+                continue
+            pai = no.pai
+            pai.filhos.remove(no)
+            pai.esquecidos.append((no.f, no.estado))
+            no.versao += 1  # invalida as entradas restantes do nó esquecido
+            propagar(pai)
+            atualizar(pai)
+            return True
+        return False
+    
+    raiz = _NoSMA(inicial, None, heuristica(inicial))
+    atualizar(raiz)
+    em_memoria = 1
+    gerados = 0  # nós criados, contando as regenerações de ramos esquecidos
+    
+    while abertos:
+        _, _, _, versao, melhor = heapq.heappop(abertos)
+        if versao != melhor.versao or not melhor.aberto():
+            continue
+        if melhor.f == infinito:
+            # Nenhum caminho até o objetivo cabe na memória disponível
+            return OrcamentoExcedido('nos', gerados, em_memoria=em_memoria)
+        if problema.estadoObjetivo(melhor.estado):
+            return problema.solucao(melhor.estado)
         
-        # Verificar se é o objetivo
-        if problema.estadoObjetivo(estado):
-            return problema.solucao(estado)
+        if melhor.novos is None:
+            # Primeira expansão: sucessores em ordem inversa (pop pelo fim), sem voltar ao avô
+            avo = melhor.pai.estado.tabuleiro if melhor.pai is not None else None
+            melhor.novos = [filho for filho in reversed(problema.funcaoSucessora(melhor.estado))
+                            if filho.tabuleiro != avo]
         
-        # Converter para string para verificação
-        estado_str = str(estado.vetor)
+        # Liberar espaço antes de escolher o filho, para que o f dos nós seja sempre
+        # calculado com todos os sucessores contabilizados
+        if em_memoria >= nos_memoria:
+            if not esquecer(melhor):
+                return OrcamentoExcedido('nos', gerados, em_memoria=em_memoria)
+            em_memoria -= 1
         
-        # Pular se já exploramos esse estado com um custo menor ou igual
-        if estado_str in explorados and explorados[estado_str] <= estado.custo:
-            continue
+        # Primeiro os sucessores nunca gerados; depois, o esquecido de menor f
+        if melhor.novos:
+            estado_filho, f_esquecido = melhor.novos.pop(), 0
+        else:
+            menor = min(range(len(melhor.esquecidos)), key=lambda i: melhor.esquecidos[i][0])
+            f_esquecido, estado_filho = melhor.esquecidos.pop(menor)
         
-        # Marcar como explorado
-        explorados[estado_str] = estado.custo
+        # Um filho na profundidade máxima que cabe na memória só serve se for o objetivo
+        if not problema.estadoObjetivo(estado_filho) and estado_filho.custo >= nos_memoria - 1:
+            f_filho = infinito
+        else:
+            f_filho = max(melhor.f, estado_filho.custo + heuristica(estado_filho), f_esquecido)
+        filho = _NoSMA(estado_filho, melhor, f_filho)
+        melhor.filhos.append(filho)
+        gerados += 1
+        em_memoria += 1
+        atualizar(filho)
         
-        # Expandir o estado
-        for estado_filho in problema.funcaoSucessora(estado):
-            filho_str = str(estado_filho.vetor)
-            
-            # Se já exploramos este estado com um custo menor, pular
-            if filho_str in explorados and explorados[filho_str] <= estado_filho.custo:
-                continue
-            
-            # Adicionar à fronteira com prioridade = custo + heurística
-            heapq.heappush(fronteira, EstadoPrioritario(estado_filho,
-                                                      estado_filho.custo +
-                                                      problema.heuristica_manhattan(estado_filho)))
+        propagar(melhor)
+        atualizar(melhor)
     
     return None  # Não encontrou solução
- 
\ No newline at end of file
+ 
+ 
+@com_orcamento
+@somente_resolvivel
+def ida_estrela(problema, estatisticas=None):
+    """Implementação do algoritmo IDA* (A* com aprofundamento iterativo)
+    
+    Usa um único tabuleiro mutável (movimento e desfazer no lugar), atualiza a
+    distância de Manhattan apenas pela peça que se moveu e nunca desfaz o
+    movimento anterior, ocupando memória proporcional à profundidade.
+    Um objeto `estatisticas.Estatisticas` opcional recebe os nós expandidos e
+    gerados em todas as iterações (sem fronteira, não há contadores de fila).
+    """
+    inicial = problema.estadoInicial
+    inicio = perf_counter()
+    expandidos = gerados = 0
+    solucao = None
+    try:
+        # Verificar se o estado inicial já é o objetivo
+        if problema.estadoObjetivo(inicial):
+            solucao = [inicial]
+            return solucao
+        
+        tabuleiro = [valor for linha in inicial.vetor for valor in linha]
+        movimentos = problema._movimentos
+        manhattan = problema._manhattan
+        orcamento = orcamento_ativo(problema)
+        caminho = []  # ações aplicadas a partir do estado inicial
+        
+        def busca(vazio, custo, h, anterior, limite):
+            """Busca em profundidade limitada por custo + heurística; retorna True ou o menor f que excedeu o limite"""
+            nonlocal expandidos, gerados
+            f = custo + h
+            if f > limite:
+                return f
+            # A distância de Manhattan só é zero no objetivo
+            if h == 0:
+                return True
+            
+            # Filhos gerados: todos os movimentos menos o que desfaria o anterior
+            filhos = len(movimentos[vazio]) - (anterior is not None)
+            expandidos += 1
+            gerados += filhos
+            if orcamento is not None:
+                orcamento.expandir(filhos)
+            
+            minimo = float('inf')
+            for acao, posicao in movimentos[vazio]:
+                # Não voltar para a posição de onde o vazio acabou de sair
+                if posicao == anterior:
+                    continue
+                
+                # Mover a peça para o vazio, atualizando a heurística só para essa peça
+                peca = tabuleiro[posicao]
+                novo_h = h - manhattan[peca][posicao] + manhattan[peca][vazio]
+                tabuleiro[vazio], tabuleiro[posicao] = peca, 0
+                caminho.append(acao)
+                
+                resultado = busca(posicao, custo + 1, novo_h, vazio, limite)
+                if resultado is True:
+                    return True
+                
+                # Desfazer o movimento
+                caminho.pop()
+                tabuleiro[vazio], tabuleiro[posicao] = 0, peca
+                if resultado < minimo:
+                    minimo = resultado
+            
+            return minimo
+        
+        h_inicial = problema.heuristica_manhattan(inicial)
+        limite = h_inicial
+        while True:
+            resultado = busca(inicial.vazio, 0, h_inicial, None, limite)
+            if resultado is True:
+                break
+            if resultado == float('inf'):
+                return None  # Não encontrou solução
+            limite = resultado
+        
+        # Só as ações são guardadas; os estados da solução são recriados ao serem lidos
+        solucao = Solucao.de_acoes(inicial, caminho)
+        return solucao
+    finally:
+        if estatisticas is not None:
+            estatisticas.registrar(expandidos, gerados, solucao, perf_counter() - inicio)
@@ -0,0 +1,198 @@
+"""Benchmark reprodutível dos algoritmos de busca
+
+Uso:
+    python benchmark.py --semente 1 --por_faixa 5 --saida benchmark.json
+    python benchmark.py --algoritmos a_estrela ida_estrela --comparar benchmark_anterior.json
+
+Gera, a partir de uma semente, instâncias resolvíveis agrupadas em faixas de
+profundidade da solução ótima, executa cada algoritmo com aquecimento e
+repetições medidas com perf_counter (cada algoritmo em um processo novo, para
+que o pico de memória seja só dele) e grava um relatório JSON com mediana, p95,
+nós por segundo e pico de RSS, que pode ser comparado entre versões.
+"""
+import argparse
+import json
+import math
+import multiprocessing
+import platform
+import random
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from estrutura import Estado, Problema, vetor_objetivo
+from algoritmos import ida_estrela
+from lote import ALGORITMOS, executar
+from orcamento import pico_memoria_mb
+from tabela import TOTAL_MAXIMO, TabelaSolucoes
+
+# Faixas de profundidade ótima (inclusivas)
+FAIXAS = [(0, 9), (10, 14), (15, 19), (20, 24), (25, 31)]
+
+# A profundidade é excluída por padrão: não é ótima e leva segundos por instância
+ALGORITMOS_PADRAO = ['largura', 'bidirecional', 'gulosa', 'a_estrela', 'a_estrela_conflito', 'ida_estrela']
+
+
+def gerar_instancias(semente, por_faixa, faixas=FAIXAS, linhas=3, colunas=3):
+    """Instâncias resolvíveis por faixa de profundidade ótima, sempre as mesmas para a mesma semente
+
+    Cada candidata é um passeio aleatório a partir do objetivo, de comprimento
+    sorteado; a profundidade ótima vem da tabela completa (tabuleiros pequenos)
+    ou do IDA*. Faixas que o tabuleiro não alcança (o 2x3 não passa de 21
+    movimentos, por exemplo) ficam incompletas depois de um número limite de
+    tentativas.
+    """
+    gerador = random.Random(semente)
+    problema = Problema(Estado(vetor=vetor_objetivo(linhas, colunas)))
+    if linhas * colunas <= TOTAL_MAXIMO:
+        profundidade = TabelaSolucoes(problema).distancia
+    else:
+        def profundidade(estado):
+            return len(ida_estrela(Problema(estado))) - 1
+
+    maior = max(fim for _, fim in faixas)
+    instancias = {faixa: [] for faixa in faixas}
+    vistos = set()
+    tentativas = 1000 * por_faixa * len(faixas)
+    while tentativas and any(len(lista) < por_faixa for lista in instancias.values()):
+        tentativas -= 1
+        estado = problema.estadoInicial
+        for _ in range(gerador.randint(1, 4 * maior)):
+            estado = gerador.choice(problema.funcaoSucessora(estado))
+        if estado.tabuleiro in vistos:
+            continue
+        vistos.add(estado.tabuleiro)
+
+        estado = Estado(tabuleiro=estado.tabuleiro, vazio=estado.vazio, linhas=linhas, colunas=colunas)
+        d = profundidade(estado)
+        for inicio, fim in faixas:
+            if inicio <= d <= fim and len(instancias[(inicio, fim)]) < por_faixa:
+                instancias[(inicio, fim)].append(([v for linha in estado.vetor for v in linha], d))
+    return instancias
+
+
+def _percentil(valores, p):
+    """Percentil pelo método do posto mais próximo"""
+    ordenados = sorted(valores)
+    return ordenados[max(0, math.ceil(p / 100 * len(ordenados)) - 1)]
+
+
+def medir_algoritmo(nome, instancias, linhas, colunas, aquecimento, repeticoes):
+    """Mede um algoritmo em todas as faixas; roda em um processo próprio"""
+    algoritmo = ALGORITMOS[nome]
+    resultados = []
+    for (inicio, fim), lista in instancias:
+        estados = [Estado(vetor=[numeros[i:i + colunas] for i in range(0, len(numeros), colunas)])
+                   for numeros, _ in lista]
+        if not estados:
+            continue
+
+        for _ in range(aquecimento):
+            algoritmo(Problema(estados[0]))
+
+        tempos = []
+        expandidos = 0
+        passos = []
+        for estado in estados:
+            # Contagem de nós em uma execução à parte, para não pesar nos tempos;
+            # algoritmos que não informam os expandidos ficam sem contagem (None)
+            solucao, contados = executar(nome, estado)
+            expandidos = None if contados is None or expandidos is None else expandidos + contados
+            passos.append(len(solucao) - 1 if solucao else None)
+
+            for _ in range(repeticoes):
+                problema = Problema(estado)
+                comeco = time.perf_counter()
+                algoritmo(problema)
+                tempos.append(time.perf_counter() - comeco)
+
+        # Tempo médio por instância, para casar com os nós expandidos por instância
+        tempo_instancia = sum(tempos) / repeticoes
+        resultados.append({
+            'algoritmo': nome,
+            'faixa': [inicio, fim],
+            'instancias': len(estados),
+            'passos': passos,
+            'mediana': statistics.median(tempos),
+            'p95': _percentil(tempos, 95),
+            'minimo': min(tempos),
+            'expandidos': expandidos,
+            'nos_por_segundo': (expandidos / tempo_instancia
+                                if expandidos is not None and tempo_instancia > 0 else None),
+        })
+
+    return resultados, pico_memoria_mb()
+
+
+def executar_benchmark(algoritmos, semente=1, por_faixa=5, aquecimento=1, repeticoes=3,
+                       linhas=3, colunas=3, faixas=FAIXAS):
+    """Gera as instâncias, mede todos os algoritmos e devolve o relatório (dicionário)"""
+    instancias = gerar_instancias(semente, por_faixa, faixas, linhas, colunas)
+    lista_instancias = list(instancias.items())
+
+    resultados = []
+    picos = {}
+    # Um processo novo para cada algoritmo: o pico de RSS de um não contamina o outro
+    contexto = multiprocessing.get_context('spawn')
+    for nome in algoritmos:
+        with ProcessPoolExecutor(max_workers=1, mp_context=contexto) as executor:
+            medidas, pico = executor.submit(medir_algoritmo, nome, lista_instancias, linhas, colunas,
+                                            aquecimento, repeticoes).result()
+        resultados.extend(medidas)
+        picos[nome] = pico
+        print(f"{nome}: concluído", file=sys.stderr)
+
+    return {
+        'configuracao': {
+            'semente': semente, 'por_faixa': por_faixa, 'aquecimento': aquecimento,
+            'repeticoes': repeticoes, 'linhas': linhas, 'colunas': colunas,
+        },
+        'ambiente': {'python': platform.python_version(), 'plataforma': platform.platform()},
+        'instancias': {f"{inicio}-{fim}": lista for (inicio, fim), lista in lista_instancias},
+        'resultados': resultados,
+        'pico_rss_mb': picos,
+    }
+
+
+def comparar_relatorios(anterior, atual, saida=sys.stdout):
+    """Mostra a variação da mediana de cada (algoritmo, faixa) entre dois relatórios"""
+    antes = {(r['algoritmo'], tuple(r['faixa'])): r for r in anterior['resultados']}
+    saida.write(f"{'Algoritmo':<20} {'Faixa':<8} {'Antes (s)':>11} {'Agora (s)':>11} {'Variação':>9}\n")
+    for r in atual['resultados']:
+        chave = (r['algoritmo'], tuple(r['faixa']))
+        if chave not in antes:
+            continue
+        mediana_antes = antes[chave]['mediana']
+        variacao = (r['mediana'] / mediana_antes - 1) * 100 if mediana_antes > 0 else float('nan')
+        faixa = f"{chave[1][0]}-{chave[1][1]}"
+        saida.write(f"{chave[0]:<20} {faixa:<8} {mediana_antes:>11.5f} {r['mediana']:>11.5f} {variacao:>+8.1f}%\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark reprodutível dos algoritmos de busca')
+    parser.add_argument('--algoritmos', nargs='+', choices=sorted(ALGORITMOS), default=ALGORITMOS_PADRAO,
+                        help='Algoritmos a medir')
+    parser.add_argument('--semente', type=int, default=1, help='Semente das instâncias')
+    parser.add_argument('--por_faixa', type=int, default=5, help='Instâncias por faixa de profundidade')
+    parser.add_argument('--aquecimento', type=int, default=1, help='Execuções de aquecimento por faixa')
+    parser.add_argument('--repeticoes', type=int, default=3, help='Execuções medidas por instância')
+    parser.add_argument('--linhas', type=int, default=3, help='Linhas do tabuleiro')
+    parser.add_argument('--colunas', type=int, default=3, help='Colunas do tabuleiro')
+    parser.add_argument('--saida', default='benchmark.json', help='Arquivo do relatório JSON')
+    parser.add_argument('--comparar', default=None, help='Relatório anterior para comparar as medianas')
+    args = parser.parse_args()
+
+    relatorio = executar_benchmark(args.algoritmos, args.semente, args.por_faixa, args.aquecimento,
+                                   args.repeticoes, args.linhas, args.colunas)
+    with open(args.saida, 'w') as arquivo:
+        json.dump(relatorio, arquivo, indent=2, ensure_ascii=False)
+    print(f"Relatório gravado em {args.saida}", file=sys.stderr)
+
+    if args.comparar:
+        with open(args.comparar, 'r') as arquivo:
+            comparar_relatorios(json.load(arquivo), relatorio)
+
+
+if __name__ == "__main__":
+    main()
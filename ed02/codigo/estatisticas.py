@@ -0,0 +1,161 @@
+"""Estatísticas de busca: contadores de nós, tamanho das estruturas e tempo por fase
+
+As buscas usam variáveis locais para as operações do laço principal (gerar
+sucessores, calcular a heurística, inserir e retirar da fronteira). Quando um
+objeto Estatisticas é passado, essas operações são trocadas por versões que
+contam e medem; sem ele, o laço roda exatamente como antes, sem custo extra.
+"""
+from time import perf_counter
+
+
+class Estatisticas:
+    """Contadores e tempos de uma execução de busca
+
+    - expandidos: estados cujos sucessores foram gerados
+    - gerados: sucessores produzidos
+    - inseridos / retirados: operações na fronteira
+    - descartados: gerados que não entraram na fronteira ou saíram dela sem
+      serem expandidos (repetidos ou, na profundidade, além do limite)
+    - fronteira_maxima / explorados_maximo: maiores tamanhos das estruturas
+    - avaliacoes: chamadas à heurística
+    - tempos: segundos em 'sucessores', 'heuristica' e 'fila'; tempo_total
+      cobre a busca inteira
+    """
+
+    def __init__(self):
+        self.expandidos = 0
+        self.gerados = 0
+        self.inseridos = 0
+        self.retirados = 0
+        self.descartados = 0
+        self.avaliacoes = 0
+        self.fronteira_maxima = 0
+        self.explorados_maximo = 0
+        self.profundidade = None
+        self.tempos = {'sucessores': 0.0, 'heuristica': 0.0, 'fila': 0.0}
+        self.tempo_total = 0.0
+        self._inicio = None
+
+    def instrumentar(self, fronteira, sucessores, inserir, retirar):
+        """Começa a medição e devolve versões medidas das operações do laço da busca"""
+        self._inicio = perf_counter()
+        tempos = self.tempos
+        # Estados colocados na fronteira antes da instrumentação (o estado inicial)
+        self.inseridos += len(fronteira)
+        self.fronteira_maxima = max(self.fronteira_maxima, len(fronteira))
+
+        def sucessores_medidos(estado):
+            inicio = perf_counter()
+            vizinhos = sucessores(estado)
+            tempos['sucessores'] += perf_counter() - inicio
+            self.expandidos += 1
+            self.gerados += len(vizinhos)
+            return vizinhos
+
+        def inserir_medido(*argumentos):
+            inicio = perf_counter()
+            inserir(*argumentos)
+            tempos['fila'] += perf_counter() - inicio
+            self.inseridos += 1
+            if len(fronteira) > self.fronteira_maxima:
+                self.fronteira_maxima = len(fronteira)
+
+        def retirar_medido():
+            inicio = perf_counter()
+            item = retirar()
+            tempos['fila'] += perf_counter() - inicio
+            self.retirados += 1
+            return item
+
+        return sucessores_medidos, inserir_medido, retirar_medido
+
+    def heuristica(self, funcao):
+        """Versão medida de uma função heurística"""
+        tempos = self.tempos
+
+        def heuristica_medida(estado):
+            inicio = perf_counter()
+            valor = funcao(estado)
+            tempos['heuristica'] += perf_counter() - inicio
+            self.avaliacoes += 1
+            return valor
+
+        return heuristica_medida
+
+    def finalizar(self, explorados, solucao):
+        """Encerra a medição com o tamanho final dos explorados e a solução encontrada (ou None)"""
+        if self._inicio is not None:
+            self.tempo_total += perf_counter() - self._inicio
+            self._inicio = None
+        # Os explorados só crescem durante a busca, então o tamanho final é o máximo
+        self.explorados_maximo = max(self.explorados_maximo, explorados)
+        self.profundidade = len(solucao) - 1 if solucao else None
+
+        # Tudo o que foi gerado e não foi inserido, ou foi retirado sem ser expandido, foi descartado;
+        # o objetivo encontrado não conta como descarte (nem o estado inicial, quando já é o objetivo
+        # ou a busca para antes de inseri-lo)
+        objetivo_gerado = 1 if solucao and len(solucao) > 1 else 0
+        self.descartados = ((self.gerados - max(self.inseridos - 1, 0))
+                            + (self.retirados - self.expandidos) - objetivo_gerado)
+
+    def registrar(self, expandidos, gerados, solucao, segundos):
+        """Resultado de uma busca sem fronteira (ex.: IDA*), que conta os próprios nós"""
+        self.expandidos += expandidos
+        self.gerados += gerados
+        self.profundidade = len(solucao) - 1 if solucao else None
+        self.tempo_total += segundos
+
+    @property
+    def fator_ramificacao(self):
+        """Fator de ramificação efetivo b*: gerados = b* + b*^2 + ... + b*^d (None sem solução)"""
+        d = self.profundidade
+        if not d or not self.gerados:
+            return None
+
+        def menor_que_gerados(b):
+            # Soma b + b^2 + ... + b^d, parando assim que passa de gerados (evita estouro)
+            soma, potencia = 0.0, 1.0
+            for _ in range(d):
+                potencia *= b
+                soma += potencia
+                if soma >= self.gerados:
+                    return False
+            return True
+
+        # Busca binária: a soma cresce com b
+        baixo, alto = 0.0, float(self.gerados)
+        for _ in range(100):
+            meio = (baixo + alto) / 2
+            if menor_que_gerados(meio):
+                baixo = meio
+            else:
+                alto = meio
+        return (baixo + alto) / 2
+
+    def como_dicionario(self):
+        """Todas as estatísticas em um dicionário (serializável em JSON)"""
+        return {
+            'expandidos': self.expandidos,
+            'gerados': self.gerados,
+            'inseridos': self.inseridos,
+            'retirados': self.retirados,
+            'descartados': self.descartados,
+            'avaliacoes': self.avaliacoes,
+            'fronteira_maxima': self.fronteira_maxima,
+            'explorados_maximo': self.explorados_maximo,
+            'profundidade': self.profundidade,
+            'fator_ramificacao': self.fator_ramificacao,
+            'tempos': dict(self.tempos),
+            'tempo_total': self.tempo_total,
+        }
+
+    def __str__(self):
+        fator = self.fator_ramificacao
+        return '\n'.join([
+            f"Nós expandidos: {self.expandidos}, gerados: {self.gerados}, descartados: {self.descartados}",
+            f"Fronteira máxima: {self.fronteira_maxima}, explorados: {self.explorados_maximo}",
+            f"Fator de ramificação efetivo: {fator:.3f}" if fator is not None else
+            "Fator de ramificação efetivo: -",
+            "Tempo: " + ", ".join(f"{fase} {segundos:.4f}s" for fase, segundos in self.tempos.items())
+            + f" (total {self.tempo_total:.4f}s)",
+        ])
@@ -1,23 +1,198 @@
+import functools
+
+# Cada peça ocupa BITS bits do inteiro que representa o tabuleiro:
+# a peça da posição p (linha * colunas + coluna) fica nos bits BITS*p a BITS*p+BITS-1.
+# 4 bits bastam até o 15-puzzle; tabuleiros maiores usam mais bits (ver bits_por_peca)
+BITS = 4
+
+# Ações na ordem dos códigos de 2 bits usados nas soluções compactas (ver Solucao)
+ACOES = ("cima", "baixo", "esquerda", "direita")
+CODIGO_ACAO = {acao: codigo for codigo, acao in enumerate(ACOES)}
+
+
+def bits_por_peca(linhas, colunas):
+    """Quantidade de bits necessária para guardar cada peça de um tabuleiro linhas x colunas"""
+    return max(BITS, (linhas * colunas - 1).bit_length())
+
+
+def empacotar(vetor, bits=BITS):
+    """Converte uma matriz (lista de listas) no inteiro compactado do tabuleiro"""
+    tabuleiro = 0
+    posicao = 0
+    for linha in vetor:
+        for valor in linha:
+            tabuleiro |= valor << (bits * posicao)
+            posicao += 1
+    return tabuleiro
+
+
+def desempacotar(tabuleiro, linhas, colunas, bits=BITS):
+    """Converte o inteiro compactado de volta para uma matriz (lista de listas)"""
+    mascara = (1 << bits) - 1
+    vetor = []
+    for i in range(linhas):
+        linha = []
+        for j in range(colunas):
+            linha.append((tabuleiro >> (bits * (i * colunas + j))) & mascara)
+        vetor.append(linha)
+    return vetor
+
+
+def vetor_objetivo(linhas, colunas):
+    """Estado objetivo de um tabuleiro linhas x colunas: 1, 2, ..., N-1 e o vazio no final"""
+    valores = list(range(1, linhas * colunas)) + [0]
+    return [valores[i * colunas:(i + 1) * colunas] for i in range(linhas)]
+
+
+def tabela_movimentos(linhas, colunas):
+    """Para cada posição do espaço vazio, lista as ações possíveis e a nova posição do vazio"""
+    # Definir os movimentos possíveis: cima, baixo, esquerda, direita
+    movimentos = [
+        ("cima", -1, 0),     # mover para cima
+        ("baixo", 1, 0),     # mover para baixo
+        ("esquerda", 0, -1),  # mover para esquerda
+        ("direita", 0, 1)     # mover para direita
+    ]
+
+    tabela = []
+    for posicao in range(linhas * colunas):
+        linha_zero, coluna_zero = divmod(posicao, colunas)
+        acoes = []
+        for acao, delta_linha, delta_coluna in movimentos:
+            nova_linha = linha_zero + delta_linha
+            nova_coluna = coluna_zero + delta_coluna
+            # Verificar se o movimento está dentro dos limites
+            if 0 <= nova_linha < linhas and 0 <= nova_coluna < colunas:
+                acoes.append((acao, nova_linha * colunas + nova_coluna))
+        tabela.append(acoes)
+    return tabela
+
+
 class Estado:
-    def __init__(self, pai=None, vetor=None, custo=0, acao=None):
+    """Nó da busca: tabuleiro compactado em um inteiro, com a posição do vazio guardada
+
+    `h` guarda a distância de Manhattan do nó quando já conhecida (None caso contrário).
+    """
+    __slots__ = ('pai', 'tabuleiro', 'vazio', 'custo', 'acao', 'linhas', 'colunas', 'h')
+
+    def __init__(self, pai=None, vetor=None, custo=0, acao=None,
+                 tabuleiro=None, vazio=None, linhas=3, colunas=3, h=None):
         self.pai = pai
-        self.vetor = [linha[:] for linha in vetor] if vetor is not None else []
         self.custo = custo
         self.acao = acao
- 
+        self.h = h
+
+        if vetor is not None:
+            self.linhas = len(vetor)
+            self.colunas = len(vetor[0]) if vetor else 0
+            self.tabuleiro = empacotar(vetor, bits_por_peca(self.linhas, self.colunas))
+            valores = [valor for linha in vetor for valor in linha]
+            self.vazio = valores.index(0) if 0 in valores else None
+        else:
+            self.linhas = linhas
+            self.colunas = colunas
+            self.tabuleiro = tabuleiro if tabuleiro is not None else 0
+            self.vazio = vazio
+
+    @classmethod
+    def filho(cls, pai, tabuleiro, vazio, acao, h=None):
+        """Cria um sucessor de `pai` sem passar pela conversão de matriz"""
+        estado = cls.__new__(cls)
+        estado.h = h
+        estado.pai = pai
+        estado.tabuleiro = tabuleiro
+        estado.vazio = vazio
+        estado.custo = pai.custo + 1
+        estado.acao = acao
+        estado.linhas = pai.linhas
+        estado.colunas = pai.colunas
+        return estado
+
+    @property
+    def vetor(self):
+        """Tabuleiro como matriz (lista de listas), reconstruído a cada acesso"""
+        return desempacotar(self.tabuleiro, self.linhas, self.colunas,
+                            bits_por_peca(self.linhas, self.colunas))
+
     def __getitem__(self, i):
         return self.vetor[i]
- 
+
     def __eq__(self, outro):
-        return isinstance(outro, Estado) and self.vetor == outro.vetor
-    
+        return isinstance(outro, Estado) and self.tabuleiro == outro.tabuleiro
+
     def __hash__(self):
-        return hash(str(self.vetor))
-    
+        return hash(self.tabuleiro)
+
     def __str__(self):
         return '\n'.join([' '.join(map(str, linha)) for linha in self.vetor])
- 
- 
+
+
+class Solucao:
+    """Solução guardada só como estado inicial e códigos de movimento (2 bits cada)
+
+    Os códigos ficam em um único inteiro: o movimento i ocupa os bits 2i e 2i+1
+    (índice em ACOES). Os estados só são recriados quando acessados, aplicando
+    os movimentos a partir do inicial; fora isso, a solução se comporta como a
+    lista de estados de `Problema.solucao` (len, índices, fatias, iteração).
+    """
+    __slots__ = ('inicial', 'codigos', 'passos')
+
+    def __init__(self, inicial, codigos=0, passos=0):
+        self.inicial = inicial
+        self.codigos = codigos
+        self.passos = passos
+
+    @classmethod
+    def de_acoes(cls, inicial, acoes):
+        """Solução a partir dos nomes das ações aplicadas ao estado inicial"""
+        codigos = 0
+        for i, acao in enumerate(acoes):
+            codigos |= CODIGO_ACAO[acao] << (2 * i)
+        return cls(inicial, codigos, len(acoes))
+
+    @property
+    def acoes(self):
+        """Nomes das ações, do estado inicial ao objetivo"""
+        codigos = self.codigos
+        return [ACOES[(codigos >> (2 * i)) & 3] for i in range(self.passos)]
+
+    def __len__(self):
+        return self.passos + 1
+
+    def __iter__(self):
+        estado = self.inicial
+        linhas, colunas = estado.linhas, estado.colunas
+        bits = bits_por_peca(linhas, colunas)
+        mascara = (1 << bits) - 1
+        deslocamentos = (-colunas, colunas, -1, 1)  # na ordem de ACOES
+        codigos = self.codigos
+
+        yield estado
+        for i in range(self.passos):
+            codigo = (codigos >> (2 * i)) & 3
+            vazio = estado.vazio
+            posicao = vazio + deslocamentos[codigo]
+            # Mesma troca da função sucessora: a peça vai para a posição antiga do vazio
+            peca = (estado.tabuleiro >> (bits * posicao)) & mascara
+            tabuleiro = estado.tabuleiro - (peca << (bits * posicao)) + (peca << (bits * vazio))
+            estado = Estado.filho(estado, tabuleiro, posicao, ACOES[codigo])
+            yield estado
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return list(self)[i]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("índice fora da solução")
+        for j, estado in enumerate(self):
+            if j == i:
+                return estado
+
+    def __repr__(self):
+        return f"Solucao(passos={self.passos}, acoes={self.acoes})"
+
+
 class Problema:
     def __init__(self, estado_inicial=None):
         if estado_inicial is None:
@@ -25,17 +200,66 @@ class Problema:
             self._estadoInicial = Estado(vetor=[[7, 1, 3], [0, 5, 6], [4, 2, 8]])
         else:
             self._estadoInicial = estado_inicial
- 
+
+        # As dimensões do tabuleiro vêm do estado inicial
+        self.linhas = self._estadoInicial.linhas
+        self.colunas = self._estadoInicial.colunas
+        self._bits = bits_por_peca(self.linhas, self.colunas)
+        self._mascara = (1 << self._bits) - 1
+        total = self.linhas * self.colunas
+
+        # Movimentos possíveis para cada posição do vazio, calculados uma única vez
+        self._movimentos = tabela_movimentos(self.linhas, self.colunas)
+
+        # Estado objetivo e tabela de distâncias de Manhattan [valor][posição], calculados uma única vez
+        self._objetivo = Estado(vetor=vetor_objetivo(self.linhas, self.colunas))
+        self._tabuleiro_objetivo = self._objetivo.tabuleiro
+        self._manhattan = [[0] * total for _ in range(total)]
+        for valor in range(1, total):
+            linha_obj, coluna_obj = divmod(valor - 1, self.colunas)
+            for posicao in range(total):
+                i, j = divmod(posicao, self.colunas)
+                self._manhattan[valor][posicao] = abs(i - linha_obj) + abs(j - coluna_obj)
+
     @property
     def estadoInicial(self):
         """Retorna o estado inicial"""
         return self._estadoInicial
- 
+
+    def no_inicial(self):
+        """Cópia do estado inicial com a distância de Manhattan guardada, raiz das buscas informadas
+
+        A partir dela a heurística passa de pai para filho na função sucessora; o
+        estado inicial do problema fica sem h, e as buscas cegas seguem sem calculá-la.
+        """
+        inicial = self._estadoInicial
+        return Estado(tabuleiro=inicial.tabuleiro, vazio=inicial.vazio, custo=inicial.custo,
+                      linhas=inicial.linhas, colunas=inicial.colunas,
+                      h=self.heuristica_manhattan(inicial))
+
     def estadoObjetivo(self, estado):
         """Define o estado objetivo ou as condições para chegar no estado objetivo"""
-        objetivo = Estado(vetor=[[1, 2, 3], [4, 5, 6], [7, 8, 0]])
-        return estado == objetivo
- 
+        # Basta comparar o tabuleiro compactado com o do objetivo, calculado uma única vez
+        return estado.tabuleiro == self._tabuleiro_objetivo
+
+    def ehResolvivel(self, estado=None):
+        """Verifica pela paridade das inversões se o objetivo é alcançável a partir do estado"""
+        if estado is None:
+            estado = self._estadoInicial
+        valores = [valor for linha in estado.vetor for valor in linha]
+        pecas = [valor for valor in valores if valor != 0]
+
+        inversoes = 0
+        for i in range(len(pecas)):
+            for j in range(i + 1, len(pecas)):
+                if pecas[i] > pecas[j]:
+                    inversoes += 1
+
+        # Cada movimento vertical muda as inversões em (colunas - 1) e a linha do vazio em 1,
+        # então essa combinação tem a mesma paridade que no objetivo (zero)
+        distancia_linha = self.linhas - 1 - valores.index(0) // self.colunas
+        return (inversoes + (self.colunas - 1) * distancia_linha) % 2 == 0
+
     def solucao(self, estado):
         """Retorna a solução do problema - caminho do estado inicial até o objetivo"""
         resultado = []
@@ -43,65 +267,134 @@ class Problema:
         while ptr:
             resultado.append(ptr)
             ptr = ptr.pai
- 
+
         resultado.reverse()
         return resultado
- 
+
+    def reconstruir(self, registros, tabuleiro, vazio):
+        """Solução compacta até `tabuleiro` a partir de uma tabela lateral de pais
+
+        `registros` leva cada tabuleiro compactado alcançado a um inteiro cujos
+        2 bits baixos são o código (em ACOES) do movimento que chegou nele; o pai
+        sai de desfazer esse movimento, sem guardar nós nem ponteiros.
+        """
+        bits = self._bits
+        mascara = self._mascara
+        deslocamentos = (-self.colunas, self.colunas, -1, 1)  # na ordem de ACOES
+        inicial = self._estadoInicial.tabuleiro
+
+        codigos = []
+        while tabuleiro != inicial:
+            codigo = registros[tabuleiro] & 3
+            codigos.append(codigo)
+            # O vazio veio de `anterior`; a peça que está lá volta para a posição atual do vazio
+            anterior = vazio - deslocamentos[codigo]
+            peca = (tabuleiro >> (bits * anterior)) & mascara
+            tabuleiro = tabuleiro - (peca << (bits * anterior)) + (peca << (bits * vazio))
+            vazio = anterior
+
+        compactos = 0
+        for i, codigo in enumerate(reversed(codigos)):
+            compactos |= codigo << (2 * i)
+        return Solucao(self._estadoInicial, compactos, len(codigos))
+
     def funcaoSucessora(self, estado):
         """Função que aplica em um estado todas as ações e retorna a lista de estados vizinhos."""
         vizinhos = []
-        # Encontrar a posição do espaço vazio (0)
-        linha_zero, coluna_zero = None, None
-        for i in range(len(estado.vetor)):
-            for j in range(len(estado.vetor[i])):
-                if estado.vetor[i][j] == 0:
-                    linha_zero, coluna_zero = i, j
-                    break
-            if linha_zero is not None:
-                break
-        
-        # Definir os movimentos possíveis: cima, baixo, esquerda, direita
-        movimentos = [
-            ("cima", -1, 0),     # mover para cima
-            ("baixo", 1, 0),     # mover para baixo
-            ("esquerda", 0, -1),  # mover para esquerda
-            ("direita", 0, 1)     # mover para direita
-        ]
-        
-        # Tentar cada movimento
-        for acao, delta_linha, delta_coluna in movimentos:
-            nova_linha = linha_zero + delta_linha
-            nova_coluna = coluna_zero + delta_coluna
-            
-            # Verificar se o movimento está dentro dos limites
-            if 0 <= nova_linha < len(estado.vetor) and 0 <= nova_coluna < len(estado.vetor[0]):
-                # Criar novo estado movendo o espaço vazio
-                novo_estado = Estado(pai=estado, vetor=estado.vetor, custo=estado.custo + 1, acao=acao)
-                
-                # Realizar a troca (mover o espaço vazio)
-                novo_estado.vetor[linha_zero][coluna_zero] = novo_estado.vetor[nova_linha][nova_coluna]
-                novo_estado.vetor[nova_linha][nova_coluna] = 0
-                
-                # Adicionar à lista de vizinhos
-                vizinhos.append(novo_estado)
-        
+        tabuleiro = estado.tabuleiro
+        bits = self._bits
+        vazio = estado.vazio
+        deslocamento_zero = bits * vazio
+        manhattan = self._manhattan
+        # Buscas informadas calculam h da raiz; a partir daí ela passa de pai para filho.
+        # Buscas cegas nunca calculam h, e os filhos ficam sem ela (None)
+        h = estado.h
+        h_filho = None
+
+        # Tentar cada movimento válido a partir da posição do espaço vazio
+        for acao, posicao in self._movimentos[estado.vazio]:
+            # Trocar a peça com o espaço vazio: a peça vai para a posição antiga do vazio
+            deslocamento = bits * posicao
+            peca = (tabuleiro >> deslocamento) & self._mascara
+            novo_tabuleiro = tabuleiro - (peca << deslocamento) + (peca << deslocamento_zero)
+
+            # Só a peça movida muda de distância, então a heurística do filho sai em O(1)
+            if h is not None:
+                h_filho = h - manhattan[peca][posicao] + manhattan[peca][vazio]
+
+            # Adicionar à lista de vizinhos
+            vizinhos.append(Estado.filho(estado, novo_tabuleiro, posicao, acao, h_filho))
+
         return vizinhos
-    
+
     def heuristica_manhattan(self, estado):
-        """Heurística de Manhattan Distance para o quebra-cabeça 3x3"""
-        objetivo = [[1, 2, 3], [4, 5, 6], [7, 8, 0]]
-        distancia = 0
-        
-        # Para cada número (exceto o 0), calcular a distância até sua posição objetivo
-        for i in range(3):
-            for j in range(3):
-                if estado.vetor[i][j] != 0:
-                    # Encontrar posição objetivo
-                    valor = estado.vetor[i][j]
-                    # Coordenadas no estado objetivo
-                    linha_obj, coluna_obj = (valor-1) // 3, (valor-1) % 3
-                    # Adicionar distância Manhattan
-                    distancia += abs(i - linha_obj) + abs(j - coluna_obj)
+        """Heurística de Manhattan Distance para o quebra-cabeça
         
+        Usa o valor guardado no nó quando existe (ver `no_inicial`); caso contrário,
+        calcula sem guardar, para não marcar estados que outras buscas também usam.
+        """
+        if estado.h is not None:
+            return estado.h
+
+        tabuleiro = estado.tabuleiro
+        bits = self._bits
+        mascara = self._mascara
+        manhattan = self._manhattan
+        distancia = 0
+
+        # Para cada número, somar a distância (pré-calculada) até sua posição objetivo;
+        # a linha do vazio (0) na tabela é toda zero
+        for posicao in range(self.linhas * self.colunas):
+            distancia += manhattan[(tabuleiro >> (bits * posicao)) & mascara][posicao]
+
         return distancia
- 
\ No newline at end of file
+
+    def heuristica_conflito_linear(self, estado):
+        """Distância de Manhattan somada a 2 movimentos por conflito linear
+
+        Duas peças estão em conflito quando estão na sua linha (ou coluna) objetivo,
+        mas em ordem invertida: uma delas precisa sair da linha e voltar. Por linha,
+        o número de peças que precisam sair é o tamanho da linha menos a maior
+        subsequência crescente das posições objetivo.
+        """
+        vetor = desempacotar(estado.tabuleiro, self.linhas, self.colunas, self._bits)
+        conflitos = 0
+
+        # Linhas: peças que pertencem a esta linha, com suas colunas objetivo na ordem atual
+        for i, linha in enumerate(vetor):
+            alvos = [(valor - 1) % self.colunas for valor in linha
+                     if valor and (valor - 1) // self.colunas == i]
+            conflitos += len(alvos) - _maior_crescente(alvos)
+
+        # Colunas: o mesmo, com as linhas objetivo
+        for j in range(self.colunas):
+            alvos = [(linha[j] - 1) // self.colunas for linha in vetor
+                     if linha[j] and (linha[j] - 1) % self.colunas == j]
+            conflitos += len(alvos) - _maior_crescente(alvos)
+
+        return self.heuristica_manhattan(estado) + 2 * conflitos
+
+
+def somente_resolvivel(busca):
+    """Decorador: devolve None sem buscar quando o estado inicial não chega ao objetivo
+
+    Estados com paridade errada nunca chegam ao objetivo (ver `Problema.ehResolvivel`),
+    então não vale a pena buscar.
+    """
+
+    @functools.wraps(busca)
+    def busca_resolvivel(problema, *args, **kwargs):
+        if not problema.ehResolvivel():
+            return None
+        return busca(problema, *args, **kwargs)
+
+    return busca_resolvivel
+
+
+def _maior_crescente(valores):
+    """Tamanho da maior subsequência estritamente crescente (listas curtas, O(n²))"""
+    melhores = []
+    for i, valor in enumerate(valores):
+        melhores.append(1 + max((melhores[j] for j in range(i) if valores[j] < valor), default=0))
+    return max(melhores, default=0)
+
@@ -0,0 +1,92 @@
+"""Filas de prioridade para a fronteira das buscas informadas
+
+As duas filas guardam no máximo um item *vivo* por chave (o tabuleiro
+compactado). Inserir de novo uma chave substitui o item anterior, que passa a
+ser ignorado quando chega a sua vez (remoção preguiçosa): é o equivalente a
+diminuir a prioridade (decrease-key) sem precisar localizar o item antigo.
+"""
+from collections import deque
+import heapq
+from itertools import count
+
+
+class FilaBaldes:
+    """Fila de baldes para prioridades inteiras pequenas (custo + heurística no quebra-cabeça)
+
+    Inserir e retirar são O(1): cada prioridade tem seu balde e o menor balde
+    não vazio só avança. Dentro de um balde, `lifo=True` retira primeiro o item
+    mais recente, o que no A* favorece os nós mais profundos (menor h para o
+    mesmo f) e chega antes ao objetivo.
+    """
+
+    def __init__(self, lifo=True):
+        self._baldes = []
+        self._minimo = 0
+        self._vivos = {}  # chave -> item atual
+        self._lifo = lifo
+
+    def __len__(self):
+        return len(self._vivos)
+
+    def __contains__(self, chave):
+        return chave in self._vivos
+
+    def inserir(self, chave, item, prioridade):
+        """Insere (ou substitui) o item da chave com a prioridade dada"""
+        baldes = self._baldes
+        while len(baldes) <= prioridade:
+            baldes.append(deque())
+        baldes[prioridade].append((chave, item))
+        self._vivos[chave] = item
+        if prioridade < self._minimo:
+            self._minimo = prioridade
+
+    def retirar(self):
+        """Remove e retorna o item vivo de menor prioridade"""
+        vivos = self._vivos
+        if not vivos:
+            raise IndexError("retirar de uma fila vazia")
+        baldes = self._baldes
+        while True:
+            balde = baldes[self._minimo]
+            if not balde:
+                self._minimo += 1
+                continue
+            chave, item = balde.pop() if self._lifo else balde.popleft()
+            # Itens substituídos por uma inserção posterior da mesma chave são descartados aqui
+            if vivos.get(chave) is item:
+                del vivos[chave]
+                return item
+
+
+class FilaHeap:
+    """Mesma interface da FilaBaldes sobre um heap binário, para prioridades quaisquer (ex.: reais)"""
+
+    def __init__(self, lifo=True):
+        self._heap = []
+        self._vivos = {}
+        # Desempate entre prioridades iguais pela ordem de inserção
+        self._contador = count()
+        self._sinal = -1 if lifo else 1
+
+    def __len__(self):
+        return len(self._vivos)
+
+    def __contains__(self, chave):
+        return chave in self._vivos
+
+    def inserir(self, chave, item, prioridade):
+        """Insere (ou substitui) o item da chave com a prioridade dada"""
+        heapq.heappush(self._heap, (prioridade, self._sinal * next(self._contador), chave, item))
+        self._vivos[chave] = item
+
+    def retirar(self):
+        """Remove e retorna o item vivo de menor prioridade"""
+        vivos = self._vivos
+        if not vivos:
+            raise IndexError("retirar de uma fila vazia")
+        while True:
+            _, _, chave, item = heapq.heappop(self._heap)
+            if vivos.get(chave) is item:
+                del vivos[chave]
+                return item
@@ -0,0 +1,218 @@
+"""Resolução em lote: lê um tabuleiro por linha e escreve um resultado JSON por linha
+
+Uso:
+    python lote.py tabuleiros.txt --algoritmo a_estrela --processos 8 > resultados.jsonl
+    cat tabuleiros.txt | python lote.py --algoritmo tabela
+    python lote.py tabuleiros.txt --algoritmo ida_estrela --max_nos 1000000 --max_memoria_mb 500
+
+Cada linha de entrada tem os números do tabuleiro separados por espaços (ou
+vírgulas), linha após linha do tabuleiro; linhas vazias ou começando com '#'
+são ignoradas. Os resultados saem na ordem em que terminam, com o número da
+linha de entrada para associá-los. Com `--max_nos` ou `--max_memoria_mb`, uma
+busca que passa do limite para e seu resultado traz o motivo no campo "erro".
+"""
+import argparse
+import json
+import math
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from estatisticas import Estatisticas
+from estrutura import Estado, Problema
+from algoritmos import (buscaEmLargura, buscaBidirecional, buscaEmProfundidade, buscaGulosa,
+                        a_estrela, ida_estrela, buscaFeixe, sma_estrela, buscaAprofundamentoIterativo)
+from orcamento import OrcamentoExcedido
+from padroes import BancoPadroes
+from paralelo import hda_estrela
+from tabela import busca_tabela
+
+# Bancos de padrões abertos neste processo, por dimensões do tabuleiro
+_bancos = {}
+
+
+def _a_estrela_padroes(problema, **limites):
+    """A* com o banco de padrões padrão do tamanho do tabuleiro"""
+    dimensoes = (problema.linhas, problema.colunas)
+    if dimensoes not in _bancos:
+        _bancos[dimensoes] = BancoPadroes(problema)
+    return a_estrela(problema, heuristica=_bancos[dimensoes], **limites)
+
+
+ALGORITMOS = {
+    'largura': buscaEmLargura,
+    'largura_compacta': lambda problema, **limites: buscaEmLargura(problema, compacta=True, **limites),
+    'bidirecional': buscaBidirecional,
+    'profundidade': buscaEmProfundidade,
+    'gulosa': buscaGulosa,
+    'a_estrela': a_estrela,
+    'a_estrela_conflito': lambda problema, **limites: a_estrela(problema,
+                                                                heuristica=problema.heuristica_conflito_linear,
+                                                                **limites),
+    'a_estrela_padroes': _a_estrela_padroes,
+    'a_estrela_compacta': lambda problema, **limites: a_estrela(problema, compacta=True, **limites),
+    'ida_estrela': ida_estrela,
+    'hda_estrela': hda_estrela,
+    'feixe': buscaFeixe,
+    'sma_estrela': sma_estrela,
+    'aprofundamento': buscaAprofundamentoIterativo,
+    'tabela': busca_tabela,
+}
+
+# Algoritmos que não expandem estados pela função sucessora: a contagem de
+# _ProblemaContado não os vê. Os de CONTAGEM_PROPRIA informam os expandidos em um
+# objeto Estatisticas; nos demais, o número fica sem valor (null)
+CONTAGEM_PROPRIA = {'ida_estrela'}
+SEM_CONTAGEM = {'largura_compacta', 'a_estrela_compacta', 'aprofundamento', 'hda_estrela', 'tabela'}
+
+# Algoritmos que não aceitam max_nos / max_memoria_mb (ver orcamento.com_orcamento)
+SEM_ORCAMENTO = {'hda_estrela', 'tabela'}
+
+
+class _ProblemaContado(Problema):
+    """Problema que conta quantos estados foram expandidos (chamadas à função sucessora)"""
+
+    def __init__(self, estado_inicial=None):
+        super().__init__(estado_inicial)
+        self.expandidos = 0
+
+    def funcaoSucessora(self, estado):
+        self.expandidos += 1
+        return super().funcaoSucessora(estado)
+
+
+def executar(algoritmo, estado, max_nos=None, max_memoria_mb=None):
+    """Resolve o estado com o algoritmo de nome dado
+
+    Retorna (solução, estados expandidos), com None no lugar dos expandidos
+    quando o algoritmo não os informa. Com limites, a solução pode ser um
+    `OrcamentoExcedido`.
+    """
+    limites = {}
+    if max_nos is not None:
+        limites['max_nos'] = max_nos
+    if max_memoria_mb is not None:
+        limites['max_memoria_mb'] = max_memoria_mb
+    if limites and algoritmo in SEM_ORCAMENTO:
+        raise ValueError(f"o algoritmo {algoritmo} não aceita max_nos nem max_memoria_mb")
+
+    if algoritmo in CONTAGEM_PROPRIA:
+        estatisticas = Estatisticas()
+        solucao = ALGORITMOS[algoritmo](Problema(estado), estatisticas=estatisticas, **limites)
+        return solucao, estatisticas.expandidos
+
+    problema = _ProblemaContado(estado)
+    solucao = ALGORITMOS[algoritmo](problema, **limites)
+    return solucao, (None if algoritmo in SEM_CONTAGEM else problema.expandidos)
+
+
+def ler_tabuleiro(linha, linhas=None, colunas=None):
+    """Converte uma linha de texto em Estado; as dimensões, se omitidas, formam um quadrado"""
+    numeros = [int(valor) for valor in linha.replace(',', ' ').split()]
+    total = len(numeros)
+    if linhas is None and colunas is None:
+        linhas = colunas = math.isqrt(total)
+    elif linhas is None:
+        linhas = total // colunas
+    elif colunas is None:
+        colunas = total // linhas
+
+    if linhas * colunas != total:
+        raise ValueError(f"{total} números não formam um tabuleiro {linhas}x{colunas}")
+    if sorted(numeros) != list(range(total)):
+        raise ValueError(f"o tabuleiro deve conter exatamente os números de 0 a {total - 1}")
+    return Estado(vetor=[numeros[i:i + colunas] for i in range(0, total, colunas)])
+
+
+def resolver(numero_linha, linha, algoritmo, linhas=None, colunas=None, max_nos=None, max_memoria_mb=None):
+    """Resolve um tabuleiro e devolve o resultado como dicionário (serializável em JSON)"""
+    resultado = {'linha': numero_linha, 'entrada': linha.strip(), 'algoritmo': algoritmo}
+    try:
+        estado = ler_tabuleiro(linha, linhas, colunas)
+    except ValueError as erro:
+        resultado['erro'] = str(erro)
+        return resultado
+
+    inicio = time.perf_counter()
+    try:
+        solucao, expandidos = executar(algoritmo, estado, max_nos, max_memoria_mb)
+    except Exception as erro:
+        # Um tabuleiro que o algoritmo não aceita (ex.: grande demais para a tabela) não para o lote
+        resultado['erro'] = f"{type(erro).__name__}: {erro}"
+        return resultado
+    resultado['tempo'] = time.perf_counter() - inicio
+
+    resultado['passos'] = len(solucao) - 1 if solucao else None
+    resultado['acoes'] = [passo.acao for passo in solucao[1:]] if solucao else None
+    resultado['expandidos'] = expandidos
+    if isinstance(solucao, OrcamentoExcedido):
+        resultado['erro'] = str(solucao)
+    return resultado
+
+
+def _linhas_entrada(arquivo):
+    """Pares (número da linha, texto) das linhas com tabuleiro"""
+    for numero, linha in enumerate(arquivo, 1):
+        if linha.strip() and not linha.lstrip().startswith('#'):
+            yield numero, linha
+
+
+def resolver_lote(arquivo, algoritmo, processos=None, linhas=None, colunas=None, saida=sys.stdout,
+                  max_nos=None, max_memoria_mb=None):
+    """Resolve todos os tabuleiros de `arquivo`, escrevendo cada resultado assim que fica pronto"""
+    def escrever(resultado):
+        saida.write(json.dumps(resultado, ensure_ascii=False) + '\n')
+        saida.flush()
+
+    if processos == 1:
+        for numero, linha in _linhas_entrada(arquivo):
+            escrever(resolver(numero, linha, algoritmo, linhas, colunas, max_nos, max_memoria_mb))
+        return
+
+    processos = processos or os.cpu_count()
+    with ProcessPoolExecutor(max_workers=processos) as executor:
+        # Manter só algumas tarefas por processo em andamento, para ler a entrada aos poucos
+        pendentes = set()
+        for numero, linha in _linhas_entrada(arquivo):
+            pendentes.add(executor.submit(resolver, numero, linha, algoritmo, linhas, colunas,
+                                          max_nos, max_memoria_mb))
+            if len(pendentes) >= 4 * processos:
+                prontas, pendentes = wait(pendentes, return_when=FIRST_COMPLETED)
+                for tarefa in prontas:
+                    escrever(tarefa.result())
+
+        while pendentes:
+            prontas, pendentes = wait(pendentes, return_when=FIRST_COMPLETED)
+            for tarefa in prontas:
+                escrever(tarefa.result())
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Resolve muitos quebra-cabeças deslizantes em paralelo')
+    parser.add_argument('arquivo', nargs='?', default='-',
+                        help='Arquivo com um tabuleiro por linha (padrão: entrada padrão)')
+    parser.add_argument('--algoritmo', choices=sorted(ALGORITMOS), default='a_estrela',
+                        help='Algoritmo de busca')
+    parser.add_argument('--processos', type=int, default=None,
+                        help='Número de processos (padrão: número de CPUs; 1 = sem paralelismo)')
+    parser.add_argument('--linhas', type=int, default=None, help='Linhas do tabuleiro (padrão: quadrado)')
+    parser.add_argument('--colunas', type=int, default=None, help='Colunas do tabuleiro (padrão: quadrado)')
+    parser.add_argument('--max_nos', type=int, default=None,
+                        help='Sucessores gerados por tabuleiro antes de desistir (padrão: sem limite)')
+    parser.add_argument('--max_memoria_mb', type=float, default=None,
+                        help='Memória residente do processo, em MB, antes de desistir (padrão: sem limite)')
+    args = parser.parse_args()
+    if args.algoritmo in SEM_ORCAMENTO and (args.max_nos is not None or args.max_memoria_mb is not None):
+        parser.error(f"o algoritmo {args.algoritmo} não aceita --max_nos nem --max_memoria_mb")
+
+    limites = {'max_nos': args.max_nos, 'max_memoria_mb': args.max_memoria_mb}
+    if args.arquivo == '-':
+        resolver_lote(sys.stdin, args.algoritmo, args.processos, args.linhas, args.colunas, **limites)
+    else:
+        with open(args.arquivo, 'r') as arquivo:
+            resolver_lote(arquivo, args.algoritmo, args.processos, args.linhas, args.colunas, **limites)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,31 +1,51 @@
 from estrutura import Estado, Problema
-from algoritmos import buscaEmLargura, buscaEmProfundidade, buscaGulosa, a_estrela
+from estatisticas import Estatisticas
+from algoritmos import (buscaEmLargura, buscaBidirecional, buscaEmProfundidade, buscaGulosa,
+                        a_estrela, ida_estrela, buscaFeixe, sma_estrela, buscaAprofundamentoIterativo)
+from orcamento import OrcamentoExcedido
+from padroes import BancoPadroes
+from paralelo import hda_estrela
+from tabela import TOTAL_MAXIMO, busca_tabela
+import sys
 import time
 import tracemalloc
  
-def executar_algoritmo(problema, algoritmo, nome_algoritmo):
-    """Executa um algoritmo de busca e mede o tempo e memória de execução"""
-    print(f"\nExecutando {nome_algoritmo}...")
-    
-    # Iniciar medição de memória
-    tracemalloc.start()
-    
-    # Medir tempo de execução
-    inicio = time.time()
-    solucao = algoritmo(problema)
-    fim = time.time()
-    tempo_execucao = fim - inicio
-    
-    # Capturar estatísticas de memória
-    pico_atual, pico_total = tracemalloc.get_traced_memory()
-    tracemalloc.stop()
+def executar_algoritmo(problema, algoritmo, nome_algoritmo, estatisticas=None):
+    """Executa um algoritmo de busca e mede o tempo e memória de execução
     
-    # Converter para MB para melhor legibilidade
-    pico_atual_mb = pico_atual / (1024 * 1024)
-    pico_total_mb = pico_total / (1024 * 1024)
+    Com um objeto Estatisticas, a busca é medida por ele em vez do tracemalloc
+    (que deixa a busca várias vezes mais lenta) e a memória não é medida.
+    """
+    print(f"\nExecutando {nome_algoritmo}...")
     
-    print(f"Tempo de execução: {tempo_execucao:.4f} segundos")
-    print(f"Uso de memória: {pico_atual_mb:.2f} MB (atual), {pico_total_mb:.2f} MB (pico)")
+    if estatisticas is not None:
+        inicio = time.perf_counter()
+        solucao = algoritmo(problema, estatisticas=estatisticas)
+        tempo_execucao = time.perf_counter() - inicio
+        pico_atual_mb = pico_total_mb = None
+        
+        print(f"Tempo de execução: {tempo_execucao:.4f} segundos")
+        print(estatisticas)
+    else:
+        # Iniciar medição de memória
+        tracemalloc.start()
+        
+        # Medir tempo de execução
+        inicio = time.time()
+        solucao = algoritmo(problema)
+        fim = time.time()
+        tempo_execucao = fim - inicio
+        
+        # Capturar estatísticas de memória
+        pico_atual, pico_total = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        
+        # Converter para MB para melhor legibilidade
+        pico_atual_mb = pico_atual / (1024 * 1024)
+        pico_total_mb = pico_total / (1024 * 1024)
+        
+        print(f"Tempo de execução: {tempo_execucao:.4f} segundos")
+        print(f"Uso de memória: {pico_atual_mb:.2f} MB (atual), {pico_total_mb:.2f} MB (pico)")
     
     if solucao:
         print(f"Encontrou solução em {len(solucao)-1} passos")
@@ -36,6 +56,8 @@ def executar_algoritmo(problema, algoritmo, nome_algoritmo):
                 if i > 0:  # Não mostrar ação para o estado inicial
                     print(f"\nPasso {i}: {estado.acao}")
                 print(estado)
+    elif isinstance(solucao, OrcamentoExcedido):
+        print(f"Busca interrompida: {solucao}")
     else:
         print("Não foi possível encontrar uma solução.")
     
@@ -45,41 +67,35 @@ def executar_algoritmo(problema, algoritmo, nome_algoritmo):
 def comparar_algoritmos(problema):
     """Compara o desempenho dos diferentes algoritmos de busca"""
     print(f"\n{'=' * 50}")
-    print(f"COMPARAÇÃO DE ALGORITMOS - QUEBRA-CABEÇA 3x3")
+    print(f"COMPARAÇÃO DE ALGORITMOS - QUEBRA-CABEÇA {problema.linhas}x{problema.colunas}")
     print(f"{'=' * 50}")
     
     print("\nEstado Inicial:")
     print(problema.estadoInicial)
     
-    resultados = []
+    # BFS, DFS e gulosa não terminam em tabuleiros com mais de 9 posições (o
+    # 15-puzzle tem ~10^13 estados): ali só entram as buscas que escalam
+    if problema.linhas * problema.colunas > 9:
+        print("\nTabuleiro com mais de 9 posições: BFS, DFS e busca gulosa ficam de fora.")
+        algoritmos = [
+            ("IDA*", ida_estrela, "IDA*"),
+            ("A* (conflito)", lambda p: a_estrela(p, heuristica=p.heuristica_conflito_linear),
+             "A* (conflito linear)"),
+        ]
+    else:
+        algoritmos = [
+            ("Busca em Largura", buscaEmLargura, "Busca em Largura (BFS)"),
+            ("Busca em Profundidade", buscaEmProfundidade, "Busca em Profundidade (DFS)"),
+            ("Busca Gulosa", buscaGulosa, "Busca Gulosa"),
+            ("A*", a_estrela, "A*"),
+            ("IDA*", ida_estrela, "IDA*"),
+        ]
     
-    # Busca em Largura (BFS)
-    solucao_bfs, tempo_bfs, memoria_bfs = executar_algoritmo(
-        problema, buscaEmLargura, "Busca em Largura (BFS)"
-    )
-    if solucao_bfs:
-        resultados.append(("Busca em Largura", len(solucao_bfs)-1, tempo_bfs, memoria_bfs))
-    
-    # Busca em Profundidade (DFS)
-    solucao_dfs, tempo_dfs, memoria_dfs = executar_algoritmo(
-        problema, buscaEmProfundidade, "Busca em Profundidade (DFS)"
-    )
-    if solucao_dfs:
-        resultados.append(("Busca em Profundidade", len(solucao_dfs)-1, tempo_dfs, memoria_dfs))
-    
-    # Busca Gulosa
-    solucao_gulosa, tempo_gulosa, memoria_gulosa = executar_algoritmo(
-        problema, buscaGulosa, "Busca Gulosa"
-    )
-    if solucao_gulosa:
-        resultados.append(("Busca Gulosa", len(solucao_gulosa)-1, tempo_gulosa, memoria_gulosa))
-    
-    # A*
-    solucao_astar, tempo_astar, memoria_astar = executar_algoritmo(
-        problema, a_estrela, "A*"
-    )
-    if solucao_astar:
-        resultados.append(("A*", len(solucao_astar)-1, tempo_astar, memoria_astar))
+    resultados = []
+    for nome, algoritmo, nome_algoritmo in algoritmos:
+        solucao, tempo, memoria = executar_algoritmo(problema, algoritmo, nome_algoritmo)
+        if solucao:
+            resultados.append((nome, len(solucao)-1, tempo, memoria))
     
     # Mostrar resumo comparativo
     print("\nRESUMO COMPARATIVO:")
@@ -92,7 +108,7 @@ def comparar_algoritmos(problema):
 def menu_principal():
     """Menu principal do programa"""
     print("\n" + "=" * 40)
-    print("QUEBRA-CABEÇA DESLIZANTE 3x3")
+    print("QUEBRA-CABEÇA DESLIZANTE")
     print("=" * 40)
     
     print("\nOpções:")
@@ -100,31 +116,64 @@ def menu_principal():
     print("2. Inserir estado inicial personalizado")
     print("3. Executar um algoritmo específico")
     print("4. Comparar todos os algoritmos")
+    print("5. Carregar estado inicial de arquivo")
     print("0. Sair")
     
     opcao = input("\nEscolha uma opção: ")
     return opcao
  
  
+def criar_estado(numeros, linhas, colunas):
+    """Valida os números do tabuleiro e cria o Estado correspondente (None se inválido)"""
+    total = linhas * colunas
+    if len(numeros) != total or set(numeros) != set(range(total)):
+        print(f"Entrada inválida! Deve conter exatamente os números de 0 a {total - 1}.")
+        return None
+    
+    # Converter para matriz linhas x colunas
+    matriz = [numeros[i:i+colunas] for i in range(0, total, colunas)]
+    estado = Estado(vetor=matriz)
+    
+    if not Problema(estado).ehResolvivel():
+        print("Atenção: este estado não tem solução (paridade das inversões).")
+    return estado
+
+
 def inserir_estado_personalizado():
     """Permite ao usuário inserir um estado inicial personalizado"""
-    print("\nInsira o estado inicial 3x3 (Use números de 0-8, onde 0 representa o espaço vazio)")
-    print("Exemplo: 7 1 3 0 5 6 4 2 8")
-    
     try:
-        numeros = list(map(int, input("Digite os 9 números separados por espaço: ").split()))
+        dimensoes = input("\nDimensões do tabuleiro (linhas colunas) [3 3]: ").split()
+        linhas, colunas = map(int, dimensoes) if dimensoes else (3, 3)
+        total = linhas * colunas
         
-        if len(numeros) != 9 or set(numeros) != set(range(9)):
-            print("Entrada inválida! Deve conter exatamente os números de 0 a 8.")
-            return None
+        print(f"\nInsira o estado inicial {linhas}x{colunas} "
+              f"(Use números de 0-{total - 1}, onde 0 representa o espaço vazio)")
+        if (linhas, colunas) == (3, 3):
+            print("Exemplo: 7 1 3 0 5 6 4 2 8")
         
-        # Converter para matriz 3x3
-        matriz = [numeros[i:i+3] for i in range(0, 9, 3)]
-        return Estado(vetor=matriz)
+        numeros = list(map(int, input(f"Digite os {total} números separados por espaço: ").split()))
+        return criar_estado(numeros, linhas, colunas)
     
     except ValueError:
         print("Entrada inválida! Use apenas números.")
         return None
+
+
+def carregar_estado_arquivo(caminho):
+    """Carrega um estado inicial de um arquivo texto, uma linha do tabuleiro por linha"""
+    try:
+        with open(caminho, 'r') as arquivo:
+            matriz = [list(map(int, linha.split())) for linha in arquivo if linha.strip()]
+    except (OSError, ValueError) as erro:
+        print(f"Não foi possível ler o arquivo: {erro}")
+        return None
+    
+    if not matriz or any(len(linha) != len(matriz[0]) for linha in matriz):
+        print("Arquivo inválido! Todas as linhas devem ter o mesmo número de peças.")
+        return None
+    
+    numeros = [valor for linha in matriz for valor in linha]
+    return criar_estado(numeros, len(matriz), len(matriz[0]))
  
  
 def selecionar_algoritmo(problema):
@@ -134,17 +183,60 @@ def selecionar_algoritmo(problema):
     print("2. Busca em Profundidade (DFS)")
     print("3. Busca Gulosa")
     print("4. A*")
+    print("5. IDA*")
+    print("6. A* (conflito linear)")
+    print("7. A* (banco de padrões)")
+    print("8. Busca em Largura Bidirecional")
+    print(f"9. Tabela completa de soluções (até {TOTAL_MAXIMO} posições)")
+    print("10. Busca em Feixe (largura 100)")
+    print("11. SMA* (10000 nós)")
+    print("12. Aprofundamento Iterativo (IDDFS)")
+    print("13. A* compacto (só códigos de movimento)")
+    print("14. HDA* (A* paralelo, um processo por CPU)")
     
     escolha = input("\nEscolha um algoritmo: ")
     
+    # As quatro buscas básicas podem contar nós e medir o tempo de cada fase
+    estatisticas = None
+    if escolha in ("1", "2", "3", "4"):
+        if input("Coletar estatísticas da busca? (s/n): ").lower() == 's':
+            estatisticas = Estatisticas()
+    
     if escolha == "1":
-        executar_algoritmo(problema, buscaEmLargura, "Busca em Largura (BFS)")
+        executar_algoritmo(problema, buscaEmLargura, "Busca em Largura (BFS)", estatisticas)
     elif escolha == "2":
-        executar_algoritmo(problema, buscaEmProfundidade, "Busca em Profundidade (DFS)")
+        executar_algoritmo(problema, buscaEmProfundidade, "Busca em Profundidade (DFS)", estatisticas)
     elif escolha == "3":
-        executar_algoritmo(problema, buscaGulosa, "Busca Gulosa")
+        executar_algoritmo(problema, buscaGulosa, "Busca Gulosa", estatisticas)
     elif escolha == "4":
-        executar_algoritmo(problema, a_estrela, "A*")
+        executar_algoritmo(problema, a_estrela, "A*", estatisticas)
+    elif escolha == "5":
+        executar_algoritmo(problema, ida_estrela, "IDA*")
+    elif escolha == "6":
+        executar_algoritmo(problema, lambda p: a_estrela(p, heuristica=p.heuristica_conflito_linear),
+                           "A* (conflito linear)")
+    elif escolha == "7":
+        # A primeira execução em cada tamanho de tabuleiro constrói e grava as tabelas
+        print("Carregando bancos de padrões...")
+        banco = BancoPadroes(problema)
+        executar_algoritmo(problema, lambda p: a_estrela(p, heuristica=banco), "A* (banco de padrões)")
+    elif escolha == "8":
+        executar_algoritmo(problema, buscaBidirecional, "Busca em Largura Bidirecional")
+    elif escolha == "9":
+        if problema.linhas * problema.colunas > TOTAL_MAXIMO:
+            print("Tabuleiro grande demais para a tabela completa.")
+        else:
+            executar_algoritmo(problema, busca_tabela, "Tabela completa de soluções")
+    elif escolha == "10":
+        executar_algoritmo(problema, buscaFeixe, "Busca em Feixe")
+    elif escolha == "11":
+        executar_algoritmo(problema, sma_estrela, "SMA*")
+    elif escolha == "12":
+        executar_algoritmo(problema, buscaAprofundamentoIterativo, "Aprofundamento Iterativo (IDDFS)")
+    elif escolha == "13":
+        executar_algoritmo(problema, lambda p: a_estrela(p, compacta=True), "A* compacto")
+    elif escolha == "14":
+        executar_algoritmo(problema, hda_estrela, "HDA*")
     else:
         print("Opção inválida!")
  
@@ -153,6 +245,12 @@ def selecionar_algoritmo(problema):
 if __name__ == "__main__":
     problema = None
     
+    # Um arquivo com o tabuleiro pode ser passado na linha de comando: python main.py tabuleiro.txt
+    if len(sys.argv) > 1:
+        estado_arquivo = carregar_estado_arquivo(sys.argv[1])
+        if estado_arquivo:
+            problema = Problema(estado_inicial=estado_arquivo)
+    
     while True:
         opcao = menu_principal()
         
@@ -196,5 +294,16 @@ if __name__ == "__main__":
             comparar_algoritmos(problema)
             input("\nPressione Enter para continuar...")
         
+        elif opcao == "5":
+            # Carregar estado de arquivo
+            caminho = input("\nCaminho do arquivo: ").strip()
+            estado_arquivo = carregar_estado_arquivo(caminho)
+            if estado_arquivo:
+                problema = Problema(estado_inicial=estado_arquivo)
+                print("\nEstado carregado:")
+                print(problema.estadoInicial)
+            
+            input("\nPressione Enter para continuar...")
+        
         else:
             print("Opção inválida! Tente novamente.")
\ No newline at end of file
@@ -0,0 +1,143 @@
+"""Limite de nós e de memória para as buscas
+
+Qualquer busca decorada com `com_orcamento` aceita `max_nos` (sucessores
+gerados) e `max_memoria_mb` (memória residente atual do processo). Ao
+atingir um dos limites, a busca para e devolve um `OrcamentoExcedido`, que é
+falso em contexto booleano como o None de "sem solução", mas diz o motivo.
+Sem limites, a busca é chamada diretamente, sem custo extra. Buscas que
+expandem tabuleiros compactados sem passar pela função sucessora contam as
+próprias expansões no objeto devolvido por `orcamento_ativo`.
+"""
+import functools
+import os
+import sys
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# A memória é consultada a cada tantas expansões (a consulta é uma chamada de sistema)
+INTERVALO_MEMORIA = 256
+
+# Páginas residentes do processo (só no Linux); o segundo campo é a memória residente atual
+_STATM = '/proc/self/statm'
+
+
+class OrcamentoExcedido:
+    """Resultado de uma busca interrompida por limite de nós ou memória"""
+
+    def __init__(self, motivo, gerados, memoria_mb=None, em_memoria=None):
+        self.motivo = motivo  # 'nos' ou 'memoria'
+        self.gerados = gerados
+        self.memoria_mb = memoria_mb
+        self.em_memoria = em_memoria  # nós mantidos ao mesmo tempo, nas buscas de memória limitada (SMA*)
+
+    def __bool__(self):
+        return False
+
+    def __repr__(self):
+        return (f"OrcamentoExcedido(motivo={self.motivo!r}, gerados={self.gerados}, "
+                f"memoria_mb={self.memoria_mb}, em_memoria={self.em_memoria})")
+
+    def __str__(self):
+        if self.motivo == 'memoria':
+            return f"Limite de memória atingido ({self.memoria_mb:.1f} MB, {self.gerados} nós gerados)"
+        if self.em_memoria is not None:
+            return f"Limite de nós atingido ({self.gerados} nós gerados, {self.em_memoria} na memória)"
+        return f"Limite de nós atingido ({self.gerados} nós gerados)"
+
+
+class _LimiteAtingido(Exception):
+    def __init__(self, resultado):
+        super().__init__(str(resultado))
+        self.resultado = resultado
+
+
+def pico_memoria_mb():
+    """Pico de memória residente do processo em MB (None sem o módulo resource)"""
+    if resource is None:
+        return None
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux informa em KB, macOS em bytes
+    return pico / (1024 * 1024) if sys.platform == 'darwin' else pico / 1024
+
+
+def memoria_mb():
+    """Memória residente atual do processo em MB
+
+    Sem /proc (macOS, por exemplo), usa o pico do processo, que nunca diminui.
+    """
+    try:
+        with open(_STATM) as statm:
+            paginas = int(statm.read().split()[1])
+    except OSError:
+        return pico_memoria_mb()
+    return paginas * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+
+
+class _Orcamento:
+    """Contadores de uma busca limitada"""
+
+    def __init__(self, max_nos, max_memoria_mb):
+        self.max_nos = max_nos
+        self.max_memoria_mb = max_memoria_mb
+        self.gerados = 0
+        self.expansoes = 0
+
+    def expandir(self, gerados):
+        """Conta uma expansão com `gerados` sucessores; interrompe a busca ao passar dos limites"""
+        self.gerados += gerados
+        self.expansoes += 1
+        if self.max_nos is not None and self.gerados > self.max_nos:
+            raise _LimiteAtingido(OrcamentoExcedido('nos', self.gerados))
+        if self.max_memoria_mb is not None and self.expansoes % INTERVALO_MEMORIA == 0:
+            memoria = memoria_mb()
+            if memoria > self.max_memoria_mb:
+                raise _LimiteAtingido(OrcamentoExcedido('memoria', self.gerados, memoria))
+
+
+def _limitar(funcao_sucessora, orcamento):
+    """Função sucessora que interrompe a busca ao passar dos limites"""
+
+    def sucessora_limitada(estado):
+        vizinhos = funcao_sucessora(estado)
+        orcamento.expandir(len(vizinhos))
+        return vizinhos
+
+    sucessora_limitada.orcamento = orcamento
+    return sucessora_limitada
+
+
+def orcamento_ativo(problema):
+    """Contadores da busca limitada em andamento sobre `problema`, ou None sem limites
+
+    O resultado tem `expandir(gerados)`, que deve ser chamado a cada expansão.
+    """
+    return getattr(problema.funcaoSucessora, 'orcamento', None)
+
+
+def com_orcamento(busca):
+    """Decorador: acrescenta `max_nos` e `max_memoria_mb` a uma busca que usa problema.funcaoSucessora"""
+
+    @functools.wraps(busca)
+    def busca_limitada(problema, *args, max_nos=None, max_memoria_mb=None, **kwargs):
+        if max_nos is None and max_memoria_mb is None:
+            return busca(problema, *args, **kwargs)
+        if max_memoria_mb is not None and resource is None and not os.path.exists(_STATM):
+            raise ValueError("max_memoria_mb precisa de /proc ou do módulo resource (indisponíveis nesta plataforma)")
+
+        # A função sucessora do próprio objeto é trocada só durante esta busca
+        anterior = vars(problema).get('funcaoSucessora')
+        problema.funcaoSucessora = _limitar(problema.funcaoSucessora, _Orcamento(max_nos, max_memoria_mb))
+        try:
+            return busca(problema, *args, **kwargs)
+        except _LimiteAtingido as limite:
+            return limite.resultado
+        finally:
+            if anterior is None:
+                del problema.funcaoSucessora
+            else:
+                problema.funcaoSucessora = anterior
+
+    return busca_limitada
@@ -0,0 +1,192 @@
+"""Heurística por bancos de padrões (pattern databases) aditivos e disjuntos
+
+Cada padrão é um subconjunto das peças. Sua tabela guarda, para cada combinação
+de posições dessas peças, o menor número de movimentos *das próprias peças do
+padrão* necessário para levá-las ao objetivo, ignorando as demais. Como os
+padrões são disjuntos e cada um só conta os movimentos das suas peças, a soma
+das tabelas continua admissível.
+
+As tabelas são construídas uma única vez por busca em largura a partir do
+objetivo, gravadas em disco como bytes (uma entrada por combinação) e abertas
+com mmap nas execuções seguintes.
+"""
+import mmap
+import os
+from array import array
+from math import perm
+
+from estrutura import tabela_movimentos
+
+# Valor das entradas ainda não alcançadas pela busca em largura
+DESCONHECIDO = 255
+
+# Diretório padrão das tabelas, ao lado deste arquivo
+DIRETORIO_PADROES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'padroes')
+
+# Partição 6-6-3 clássica do 15-puzzle (cada tabela de 6 peças ocupa 5,7 MB,
+# mas a construção em Python puro leva dezenas de minutos)
+PARTICAO_15_663 = [(1, 2, 3, 5, 6, 7), (9, 10, 11, 13, 14, 15), (4, 8, 12)]
+
+
+def particao_padrao(linhas, colunas):
+    """Partição usada quando nenhuma é informada
+
+    Até 8 peças, um único padrão com todas elas (tabela exata: no 8-puzzle,
+    as 9!/2 configurações alcançáveis); acima disso, grupos de até 5 peças em
+    ordem, que ficam prontos em poucos minutos.
+    """
+    pecas = list(range(1, linhas * colunas))
+    if len(pecas) <= 8:
+        return [tuple(pecas)]
+    return [tuple(pecas[i:i + 5]) for i in range(0, len(pecas), 5)]
+
+
+def indice_padrao(posicoes, total):
+    """Índice compacto (arranjo de k posições entre `total`) das posições das peças"""
+    indice = 0
+    usadas = 0
+    for i, posicao in enumerate(posicoes):
+        # Quantas posições livres existem antes desta: o "dígito" do arranjo
+        indice = indice * (total - i) + posicao - (usadas & ((1 << posicao) - 1)).bit_count()
+        usadas |= 1 << posicao
+    return indice
+
+
+def construir_padrao(linhas, colunas, pecas):
+    """Constrói a tabela de um padrão por busca em largura 0-1 a partir do objetivo
+
+    O estado abstrato é (posições das peças do padrão, posição do vazio). Mover
+    uma peça do padrão custa 1; mover qualquer outra peça (só o vazio muda, do
+    ponto de vista do padrão) custa 0. A tabela guarda o mínimo sobre as
+    posições do vazio.
+    """
+    total = linhas * colunas
+    k = len(pecas)
+    movimentos = [[posicao for _, posicao in acoes] for acoes in tabela_movimentos(linhas, colunas)]
+
+    tabela = array('B', [DESCONHECIDO]) * perm(total, k)
+    distancias = bytearray([DESCONHECIDO]) * (len(tabela) * total)
+
+    # A fronteira guarda cada estado codificado como vazio + total * (posições em base `total`),
+    # que se decodifica só com divmod
+    pesos = [total ** (j + 1) for j in range(k)]
+    objetivo = [peca - 1 for peca in pecas]
+    vazio_objetivo = total - 1
+    indice = indice_padrao(objetivo, total)
+    tabela[indice] = 0
+    distancias[indice * total + vazio_objetivo] = 0
+    atual = array('I', [vazio_objetivo + sum(p * w for p, w in zip(objetivo, pesos))])
+
+    distancia = 0
+    while atual:
+        proximo = array('I')
+        i = 0
+        # Movimentos de custo 0 entram no fim de `atual` e são processados na mesma camada
+        while i < len(atual):
+            codigo = atual[i]
+            i += 1
+            codigo_pecas, vazio = divmod(codigo, total)
+            posicoes = []
+            for _ in range(k):
+                codigo_pecas, posicao = divmod(codigo_pecas, total)
+                posicoes.append(posicao)
+            indice = indice_padrao(posicoes, total)
+            if distancias[indice * total + vazio] != distancia:
+                continue  # já alcançado com custo menor
+            base = codigo - vazio
+
+            for posicao in movimentos[vazio]:
+                if posicao in posicoes:
+                    # Peça do padrão vai para o antigo vazio: custo 1
+                    j = posicoes.index(posicao)
+                    posicoes[j] = vazio
+                    novo_indice = indice_padrao(posicoes, total)
+                    posicoes[j] = posicao
+                    chave = novo_indice * total + posicao
+                    if distancias[chave] > distancia + 1:
+                        distancias[chave] = distancia + 1
+                        if tabela[novo_indice] > distancia + 1:
+                            tabela[novo_indice] = distancia + 1
+                        proximo.append(base + (vazio - posicao) * pesos[j] + posicao)
+                else:
+                    # Peça fora do padrão: só o vazio muda, custo 0
+                    chave = indice * total + posicao
+                    if distancias[chave] > distancia:
+                        distancias[chave] = distancia
+                        atual.append(base + posicao)
+
+        atual = proximo
+        distancia += 1
+
+    return tabela
+
+
+def caminho_padrao(linhas, colunas, pecas, diretorio=DIRETORIO_PADROES):
+    """Arquivo em que a tabela de um padrão é gravada"""
+    nome = f"pdb_{linhas}x{colunas}_{'-'.join(map(str, pecas))}.bin"
+    return os.path.join(diretorio, nome)
+
+
+def carregar_padrao(linhas, colunas, pecas, diretorio=DIRETORIO_PADROES):
+    """Abre a tabela de um padrão com mmap, construindo e gravando antes se preciso"""
+    caminho = caminho_padrao(linhas, colunas, pecas, diretorio)
+    tamanho = perm(linhas * colunas, len(pecas))
+
+    if not os.path.exists(caminho) or os.path.getsize(caminho) != tamanho:
+        tabela = construir_padrao(linhas, colunas, pecas)
+        os.makedirs(diretorio, exist_ok=True)
+        # Gravar em um arquivo temporário para nunca deixar uma tabela pela metade
+        temporario = caminho + '.tmp'
+        with open(temporario, 'wb') as arquivo:
+            tabela.tofile(arquivo)
+        os.replace(temporario, caminho)
+
+    with open(caminho, 'rb') as arquivo:
+        return mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class BancoPadroes:
+    """Heurística aditiva: soma das tabelas de padrões disjuntos
+
+    Pode ser passada diretamente como `heuristica` para `buscaGulosa` e `a_estrela`.
+    """
+
+    def __init__(self, problema, particao=None, diretorio=DIRETORIO_PADROES):
+        self.linhas = problema.linhas
+        self.colunas = problema.colunas
+        self._bits = problema._bits
+        self._mascara = problema._mascara
+        self._total = self.linhas * self.colunas
+
+        if particao is None:
+            particao = particao_padrao(self.linhas, self.colunas)
+        particao = [tuple(pecas) for pecas in particao]
+        todas = [peca for pecas in particao for peca in pecas]
+        if len(todas) != len(set(todas)) or not set(todas) <= set(range(1, self._total)):
+            raise ValueError("Os padrões devem ser conjuntos disjuntos de peças do tabuleiro")
+
+        self.particao = particao
+        self._tabelas = [(carregar_padrao(self.linhas, self.colunas, pecas, diretorio), pecas)
+                         for pecas in particao]
+
+    def __call__(self, estado):
+        tabuleiro = estado.tabuleiro
+        bits = self._bits
+        mascara = self._mascara
+        total = self._total
+
+        # Posição de cada peça no tabuleiro compactado
+        posicoes = [0] * total
+        for posicao in range(total):
+            posicoes[(tabuleiro >> (bits * posicao)) & mascara] = posicao
+
+        h = 0
+        for tabela, pecas in self._tabelas:
+            indice = 0
+            usadas = 0
+            for i, peca in enumerate(pecas):
+                posicao = posicoes[peca]
+                indice = indice * (total - i) + posicao - (usadas & ((1 << posicao) - 1)).bit_count()
+                usadas |= 1 << posicao
+            h += tabela[indice]
+        return h
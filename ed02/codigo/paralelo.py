@@ -0,0 +1,225 @@
+"""A* paralelo com distribuição por hash (HDA*)
+
+Cada estado tem um dono, escolhido pelo hash do tabuleiro compactado entre os
+processos trabalhadores. Cada trabalhador guarda a fronteira e os custos só dos
+seus estados; os sucessores de outros donos são juntados em lotes e enviados
+pela fila de entrada do dono. O caminho viaja com o nó como códigos de 2 bits
+(ver `estrutura.Solucao`), então ninguém precisa de ponteiros para pais.
+
+A primeira solução encontrada não é necessariamente a melhor: ela vira um
+limite (custo + heurística >= limite é podado) e a busca continua até que todos
+os trabalhadores estejam ociosos sem mensagens em trânsito. O coordenador
+detecta isso com contadores de lotes enviados e recebidos, confirmados por uma
+segunda consulta com os mesmos valores (método dos quatro contadores de Mattern).
+"""
+import multiprocessing
+import os
+from queue import Empty
+
+from algoritmos import _movimentos_codificados
+from estrutura import Solucao, somente_resolvivel
+from filas import FilaBaldes
+
+# Expansões entre dois envios de lotes (mais expansões: lotes maiores e menos mensagens)
+EXPANSOES_POR_LOTE = 64
+
+# Multiplicador de Fibonacci: espalha os bits do tabuleiro antes do resto da divisão
+_MULTIPLICADOR = 0x9E3779B97F4A7C15
+
+# Segundos de espera do coordenador antes de conferir se os trabalhadores seguem vivos
+_ESPERA = 1.0
+
+
+def dono(tabuleiro, processos):
+    """Índice do trabalhador responsável pelo tabuleiro compactado"""
+    return ((tabuleiro * _MULTIPLICADOR) >> 32) % processos
+
+
+def _trabalhador(indice, problema, entradas, coordenador):
+    """Laço de um trabalhador: recebe nós, expande os seus e envia os dos outros em lotes
+
+    Um nó é a tupla (tabuleiro, vazio, custo, h, códigos do caminho).
+    """
+    processos = len(entradas)
+    entrada = entradas[indice]
+    objetivo = problema._tabuleiro_objetivo
+    movimentos = _movimentos_codificados(problema)
+    bits = problema._bits
+    mascara = problema._mascara
+    manhattan = problema._manhattan
+
+    custos = {}  # tabuleiro -> menor custo recebido
+    fronteira = FilaBaldes()
+    lotes = [[] for _ in range(processos)]
+    limite = float('inf')
+    enviados = recebidos = 0
+    informado = None  # último (ocioso, enviados, recebidos) passado ao coordenador
+
+    def considerar(no):
+        tabuleiro, _, custo, h, _ = no
+        if custo + h >= limite:
+            return
+        conhecido = custos.get(tabuleiro)
+        if conhecido is not None and conhecido <= custo:
+            return
+        custos[tabuleiro] = custo
+        fronteira.inserir(tabuleiro, no, custo + h)
+
+    def tratar(mensagem):
+        """Processa uma mensagem recebida; retorna False quando o trabalhador deve parar"""
+        nonlocal limite, recebidos, informado
+        tipo = mensagem[0]
+        if tipo == 'nos':
+            recebidos += 1
+            for no in mensagem[1]:
+                considerar(no)
+        elif tipo == 'limite':
+            limite = min(limite, mensagem[1])
+        elif tipo == 'consulta':
+            informado = (not fronteira, enviados, recebidos)
+            coordenador.put(('resposta', mensagem[1], indice) + informado)
+        elif tipo == 'fim':
+            return False
+        return True
+
+    while True:
+        # Tratar tudo o que já chegou, sem esperar
+        try:
+            while True:
+                if not tratar(entrada.get_nowait()):
+                    return
+        except Empty:
+            pass
+
+        if not fronteira:
+            # Ocioso: avisar o coordenador (se algo mudou desde o último aviso) e esperar mensagens
+            if informado != (True, enviados, recebidos):
+                informado = (True, enviados, recebidos)
+                coordenador.put(('estado', indice) + informado)
+            if not tratar(entrada.get()):
+                return
+            continue
+
+        for _ in range(EXPANSOES_POR_LOTE):
+            if not fronteira:
+                break
+            no = fronteira.retirar()
+            tabuleiro, vazio, custo, h, codigos = no
+            if custo + h >= limite:
+                # A fila devolve em ordem de f: nada do que sobrou pode melhorar o limite
+                fronteira = FilaBaldes()
+                break
+            if tabuleiro == objetivo:
+                limite = custo
+                coordenador.put(('solucao', custo, codigos))
+                continue
+
+            custo_filho = custo + 1
+            deslocamento_zero = bits * vazio
+            for codigo, posicao in movimentos[vazio]:
+                deslocamento = bits * posicao
+                peca = (tabuleiro >> deslocamento) & mascara
+                novo_tabuleiro = tabuleiro - (peca << deslocamento) + (peca << deslocamento_zero)
+                h_filho = h - manhattan[peca][posicao] + manhattan[peca][vazio]
+                if custo_filho + h_filho >= limite:
+                    continue
+
+                filho = (novo_tabuleiro, posicao, custo_filho, h_filho, codigos | codigo << (2 * custo))
+                destino = dono(novo_tabuleiro, processos)
+                if destino == indice:
+                    considerar(filho)
+                else:
+                    lotes[destino].append(filho)
+
+        for destino, lote in enumerate(lotes):
+            if lote:
+                entradas[destino].put(('nos', lote))
+                enviados += 1
+                lotes[destino] = []
+
+
+@somente_resolvivel
+def hda_estrela(problema, processos=None):
+    """Implementação do A* paralelo com distribuição por hash (HDA*)
+
+    Usa `processos` trabalhadores (padrão: número de CPUs) e a distância de
+    Manhattan. A solução tem o mesmo comprimento ótimo da de `a_estrela` e
+    volta como `estrutura.Solucao`.
+    """
+    inicial = problema.estadoInicial
+    if problema.estadoObjetivo(inicial):
+        return Solucao(inicial)
+
+    processos = processos or os.cpu_count()
+    entradas = [multiprocessing.Queue() for _ in range(processos)]
+    coordenador = multiprocessing.Queue()
+    trabalhadores = [multiprocessing.Process(target=_trabalhador, args=(i, problema, entradas, coordenador),
+                                             daemon=True)
+                     for i in range(processos)]
+    for trabalhador in trabalhadores:
+        trabalhador.start()
+
+    try:
+        # O estado inicial é o único lote enviado pelo coordenador
+        h = problema.heuristica_manhattan(inicial)
+        entradas[dono(inicial.tabuleiro, processos)].put(('nos', [(inicial.tabuleiro, inicial.vazio, 0, h, 0)]))
+
+        melhor = None  # (custo, códigos)
+        estados = [(False, 0, 0)] * processos  # último (ocioso, enviados, recebidos) de cada trabalhador
+        rodada = 0
+        consulta = None  # estados no início da consulta em andamento
+        respostas = {}
+        recusada = None  # estados de uma consulta que não confirmou o término
+
+        while True:
+            try:
+                mensagem = coordenador.get(timeout=_ESPERA)
+            except Empty:
+                if not all(trabalhador.is_alive() for trabalhador in trabalhadores):
+                    raise RuntimeError("Um trabalhador do HDA* terminou inesperadamente")
+                continue
+
+            tipo = mensagem[0]
+            if tipo == 'solucao':
+                _, custo, codigos = mensagem
+                if melhor is None or custo < melhor[0]:
+                    melhor = (custo, codigos)
+                    for entrada in entradas:
+                        entrada.put(('limite', custo))
+            elif tipo == 'estado':
+                _, indice, *contadores = mensagem
+                estados[indice] = tuple(contadores)
+            elif tipo == 'resposta':
+                _, numero, indice, *contadores = mensagem
+                estados[indice] = tuple(contadores)
+                if numero == rodada and consulta is not None:
+                    respostas[indice] = tuple(contadores)
+
+            if consulta is not None:
+                if len(respostas) < processos:
+                    continue
+                # Término: ninguém trabalhou, enviou ou recebeu entre os avisos e as respostas
+                if all(respostas[i] == consulta[i] for i in range(processos)):
+                    break
+                recusada, consulta = consulta, None
+
+            # Todos ociosos, com cada lote enviado (mais o inicial) já recebido: confirmar com uma consulta
+            atual = tuple(estados)
+            ociosos = all(ocioso for ocioso, _, _ in atual)
+            enviados = 1 + sum(enviados for _, enviados, _ in atual)
+            recebidos = sum(recebidos for _, _, recebidos in atual)
+            if ociosos and enviados == recebidos and atual != recusada:
+                rodada += 1
+                consulta, respostas = atual, {}
+                for entrada in entradas:
+                    entrada.put(('consulta', rodada))
+    finally:
+        for entrada in entradas:
+            entrada.put(('fim',))
+        for trabalhador in trabalhadores:
+            trabalhador.join(timeout=_ESPERA)
+            if trabalhador.is_alive():
+                trabalhador.terminate()
+
+    custo, codigos = melhor
+    return Solucao(inicial, codigos, custo)
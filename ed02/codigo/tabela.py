@@ -0,0 +1,140 @@
+"""Tabela completa de soluções para tabuleiros pequenos (8-puzzle)
+
+Uma busca em largura retrógrada a partir do objetivo visita todos os estados
+alcançáveis (181.440 no 3x3) e guarda, para cada um, a distância até o objetivo
+e a melhor ação. A tabela é um vetor de bytes indexado pela ordem lexicográfica
+da permutação do tabuleiro (código de Lehmer), gravado em disco e aberto com
+mmap; resolver um estado é só descer a tabela, O(profundidade).
+"""
+import mmap
+import os
+from collections import deque
+from math import factorial
+
+from estrutura import ACOES, CODIGO_ACAO
+from padroes import DIRETORIO_PADROES
+
+# Cada byte guarda a distância nos 6 bits baixos e o código da ação (índice em ACOES) nos 2 altos
+BITS_DISTANCIA = 6
+MASCARA_DISTANCIA = (1 << BITS_DISTANCIA) - 1
+DISTANCIA_MAXIMA = MASCARA_DISTANCIA - 1
+
+# Estados que não alcançam o objetivo (paridade errada)
+INALCANCAVEL = 255
+
+# Maior tabuleiro aceito: a tabela ocupa (linhas * colunas)! bytes
+TOTAL_MAXIMO = 10
+
+
+def ordem_tabuleiro(tabuleiro, total, bits, mascara):
+    """Posição (código de Lehmer) do tabuleiro compactado entre as total! permutações"""
+    indice = 0
+    usados = 0
+    for posicao in range(total):
+        valor = (tabuleiro >> (bits * posicao)) & mascara
+        # Quantos valores menores ainda não apareceram: o dígito desta posição
+        indice = indice * (total - posicao) + valor - (usados & ((1 << valor) - 1)).bit_count()
+        usados |= 1 << valor
+    return indice
+
+
+def construir_tabela(problema):
+    """Busca em largura retrógrada a partir do objetivo do problema"""
+    total = problema.linhas * problema.colunas
+    if total > TOTAL_MAXIMO:
+        raise ValueError(f"Tabela completa só para tabuleiros de até {TOTAL_MAXIMO} posições")
+
+    bits = problema._bits
+    mascara = problema._mascara
+    movimentos = problema._movimentos
+    # Ação contrária: do filho, o vazio volta para onde estava no pai
+    contraria = {"cima": "baixo", "baixo": "cima", "esquerda": "direita", "direita": "esquerda"}
+
+    tabela = bytearray([INALCANCAVEL]) * factorial(total)
+    objetivo = problema._objetivo
+    tabela[ordem_tabuleiro(objetivo.tabuleiro, total, bits, mascara)] = 0
+    fronteira = deque([(objetivo.tabuleiro, objetivo.vazio, 0)])
+
+    while fronteira:
+        tabuleiro, vazio, distancia = fronteira.popleft()
+        if distancia == DISTANCIA_MAXIMA:
+            raise ValueError("Distância grande demais para a tabela de bytes")
+        deslocamento_zero = bits * vazio
+
+        for acao, posicao in movimentos[vazio]:
+            deslocamento = bits * posicao
+            peca = (tabuleiro >> deslocamento) & mascara
+            novo_tabuleiro = tabuleiro - (peca << deslocamento) + (peca << deslocamento_zero)
+            indice = ordem_tabuleiro(novo_tabuleiro, total, bits, mascara)
+            if tabela[indice] != INALCANCAVEL:
+                continue
+            tabela[indice] = (distancia + 1) | (CODIGO_ACAO[contraria[acao]] << BITS_DISTANCIA)
+            fronteira.append((novo_tabuleiro, posicao, distancia + 1))
+
+    return tabela
+
+
+class TabelaSolucoes:
+    """Distância exata e melhor ação de todos os estados de um tabuleiro pequeno
+
+    Também serve como heurística exata para `buscaGulosa` e `a_estrela`.
+    """
+
+    def __init__(self, problema, diretorio=DIRETORIO_PADROES):
+        self.problema = problema
+        self._total = problema.linhas * problema.colunas
+        caminho = os.path.join(diretorio, f"solucoes_{problema.linhas}x{problema.colunas}.bin")
+
+        if not os.path.exists(caminho) or os.path.getsize(caminho) != factorial(self._total):
+            tabela = construir_tabela(problema)
+            os.makedirs(diretorio, exist_ok=True)
+            # Gravar em um arquivo temporário para nunca deixar uma tabela pela metade
+            temporario = caminho + '.tmp'
+            with open(temporario, 'wb') as arquivo:
+                arquivo.write(tabela)
+            os.replace(temporario, caminho)
+
+        with open(caminho, 'rb') as arquivo:
+            self._tabela = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _entrada(self, estado):
+        return self._tabela[ordem_tabuleiro(estado.tabuleiro, self._total,
+                                            self.problema._bits, self.problema._mascara)]
+
+    def distancia(self, estado):
+        """Número mínimo de movimentos até o objetivo (None se inalcançável)"""
+        entrada = self._entrada(estado)
+        return None if entrada == INALCANCAVEL else entrada & MASCARA_DISTANCIA
+
+    def __call__(self, estado):
+        return self._entrada(estado) & MASCARA_DISTANCIA
+
+    def resolver(self, estado=None):
+        """Solução ótima (lista de estados, como `problema.solucao`) por descida na tabela"""
+        problema = self.problema
+        if estado is None:
+            estado = problema.estadoInicial
+
+        entrada = self._entrada(estado)
+        if entrada == INALCANCAVEL:
+            return None  # Não há solução
+
+        # Cada entrada indica a ação que leva a um estado uma unidade mais perto do objetivo
+        while entrada & MASCARA_DISTANCIA:
+            acao = ACOES[entrada >> BITS_DISTANCIA]
+            estado = next(filho for filho in problema.funcaoSucessora(estado) if filho.acao == acao)
+            entrada = self._entrada(estado)
+        return problema.solucao(estado)
+
+
+# Tabelas já abertas, por dimensões do tabuleiro
+_tabelas = {}
+
+
+def busca_tabela(problema):
+    """Resolve o problema pela tabela completa, abrindo (ou construindo) a tabela uma vez por processo"""
+    dimensoes = (problema.linhas, problema.colunas)
+    tabela = _tabelas.get(dimensoes)
+    if tabela is None:
+        tabela = _tabelas[dimensoes] = TabelaSolucoes(problema)
+    return tabela.resolver(problema.estadoInicial)
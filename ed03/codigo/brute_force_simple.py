@@ -3,47 +3,67 @@
 Brute force solution for TSP (simplified version)
 """
 import time
+import argparse
 import itertools
-from tsp_simple import load_cities, total_distance
+from tsp_simple import DistanceMatrix, load_cities, total_distance
+from exact_tsp_simple import held_karp_tsp, branch_and_bound_tsp
 
-def brute_force_tsp(cities):
+def brute_force_tsp(cities, distance_matrix=None):
     """Solve TSP using brute force approach"""
+    if distance_matrix is None:
+        distance_matrix = DistanceMatrix(cities)
+    
     # Get city IDs
     city_ids = [city[0] for city in cities]
-    
-    # Generate all possible permutations (routes)
-    all_routes = list(itertools.permutations(city_ids))
+    first, rest = city_ids[0], city_ids[1:]
     
     # Find the route with minimum distance
     min_distance = float('inf')
     best_route = None
     
-    for route in all_routes:
-        dist = total_distance(route, cities)
+    # Stream the permutations with the first city fixed (rotations are the same tour)
+    for tail in itertools.permutations(rest):
+        # Skip the reversed copy of every tour
+        if len(tail) > 1 and tail[0] > tail[-1]:
+            continue
+        route = (first,) + tail
+        dist = total_distance(route, distance_matrix)
         if dist < min_distance:
             min_distance = dist
             best_route = route
     
     return best_route, min_distance
 
+SOLVERS = {
+    'brute-force': brute_force_tsp,
+    'held-karp': held_karp_tsp,
+    'branch-and-bound': branch_and_bound_tsp
+}
+
 def main():
+    # Parse command line arguments
+    parser = argparse.ArgumentParser(description='Solve TSP exactly')
+    parser.add_argument('--file', type=str, default='tsp.csv', help='CSV file with city coordinates')
+    parser.add_argument('--method', type=str, default='held-karp',
+                        choices=list(SOLVERS), help='Exact solver')
+    parser.add_argument('--cities', type=int, default=None,
+                        help='Use only the first N cities of the file')
+    args = parser.parse_args()
+    
     # Load cities
-    cities = load_cities('tsp.csv')
+    cities = load_cities(args.file)
     
-    # Only use brute force for small instances (limit to 8 cities)
-    # if len(cities) > 8:
-    #     print(f"Warning: Brute force is not feasible for {len(cities)} cities.")
-    #     print("Consider using a smaller subset of cities.")
-    #     num_cities = int(input("Enter number of cities to use (1-8): "))
-    #     cities = cities[:num_cities]
+    # Exact solvers are only feasible for small instances (about 20-25 cities)
+    if args.cities is not None:
+        cities = cities[:args.cities]
     
-    print(f"Solving TSP with brute force for {len(cities)} cities...")
+    print(f"Solving TSP with {args.method} for {len(cities)} cities...")
     
     # Record start time
     start_time = time.time()
     
-    # Run brute force algorithm
-    best_route, best_distance = brute_force_tsp(cities)
+    # Run exact algorithm
+    best_route, best_distance = SOLVERS[args.method](cities)
     
     # Calculate elapsed time
     elapsed_time = (time.time() - start_time) * 1000  # Convert to milliseconds
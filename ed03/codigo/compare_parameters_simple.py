@@ -2,21 +2,34 @@
 """
 Script to compare different parameter configurations for genetic algorithm (simplified)
 """
+import os
 import time
 import csv
-from tsp_simple import load_cities, total_distance
+import argparse
+import statistics
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from tsp_simple import load_cities, total_distance, DistanceMatrix
 from genetic_algorithm_simple import GeneticAlgorithm
 
+RUN_FIELDS = ['Instance', 'Configuration', 'Seed', 'Generations', 'Best Distance', 'Elapsed Time (ms)']
+
+# Cities and distance matrix per instance file, loaded once per worker process
+_instances = {}
+
 def run_experiment(cities, configurations, generations=100):
     """Run genetic algorithm with different configurations"""
     results = []
     
+    # Share one distance matrix across all configurations
+    distance_matrix = DistanceMatrix(cities)
+    
     for config in configurations:
-        name = config.pop("name")
+        params = dict(config)
+        name = params.pop("name")
         print(f"\nRunning experiment: {name}")
         
         # Initialize genetic algorithm with configuration
-        ga = GeneticAlgorithm(cities=cities, **config)
+        ga = GeneticAlgorithm(cities=cities, distance_matrix=distance_matrix, **params)
         
         # Record start time
         start_time = time.time()
@@ -42,10 +55,127 @@ def run_experiment(cities, configurations, generations=100):
     
     return results
 
+def _load_instance(filename):
+    """Load an instance file once per process"""
+    if filename not in _instances:
+        cities = load_cities(filename)
+        _instances[filename] = (cities, DistanceMatrix(cities))
+    return _instances[filename]
+
+def _run_single(filename, config, seed, generations):
+    """Run one (instance, configuration, seed) combination inside a worker process"""
+    cities, distance_matrix = _load_instance(filename)
+    params = {key: value for key, value in config.items() if key != "name"}
+    
+    ga = GeneticAlgorithm(cities=cities, distance_matrix=distance_matrix, seed=seed, **params)
+    start_time = time.time()
+    _, best_distance, _ = ga.run(generations, verbose=False)
+    elapsed_time = (time.time() - start_time) * 1000  # Convert to milliseconds
+    
+    return {
+        "Instance": filename,
+        "Configuration": config["name"],
+        "Seed": seed,
+        "Generations": generations,
+        "Best Distance": best_distance,
+        "Elapsed Time (ms)": elapsed_time
+    }
+
+def load_completed_runs(output_file):
+    """Read the runs already stored in a sweep CSV (empty list if there is none)"""
+    if not os.path.exists(output_file):
+        return []
+    
+    runs = []
+    with open(output_file, 'r', newline='') as csvfile:
+        reader = csv.DictReader(csvfile)
+        if reader.fieldnames is not None and reader.fieldnames != RUN_FIELDS:
+            raise ValueError(f"{output_file} has columns {reader.fieldnames}, expected {RUN_FIELDS}; "
+                             f"use a different --output to start a new sweep")
+        for row in reader:
+            runs.append({
+                "Instance": row["Instance"],
+                "Configuration": row["Configuration"],
+                "Seed": int(row["Seed"]),
+                "Generations": int(row["Generations"]),
+                "Best Distance": float(row["Best Distance"]),
+                "Elapsed Time (ms)": float(row["Elapsed Time (ms)"])
+            })
+    return runs
+
+def run_sweep(configurations, instance_files, seeds, generations=100,
+              output_file='ga_comparison_runs.csv', workers=None):
+    """Run every configuration x seed x instance on a process pool
+    
+    Each run is appended to output_file as soon as it finishes. Runs already
+    present in output_file with the same number of generations are skipped, so
+    an interrupted sweep can be resumed. Returns the runs with this number of
+    generations, including the ones loaded from the file.
+    """
+    runs = [run for run in load_completed_runs(output_file) if run["Generations"] == generations]
+    completed = {(run["Instance"], run["Configuration"], run["Seed"]) for run in runs}
+    
+    pending = [(filename, config, seed)
+               for filename in instance_files
+               for config in configurations
+               for seed in seeds
+               if (filename, config["name"], seed) not in completed]
+    print(f"{len(completed)} runs already completed, {len(pending)} to go")
+    
+    write_header = not os.path.exists(output_file) or os.path.getsize(output_file) == 0
+    with open(output_file, 'a', newline='') as csvfile, \
+            ProcessPoolExecutor(max_workers=workers) as executor:
+        writer = csv.DictWriter(csvfile, fieldnames=RUN_FIELDS)
+        if write_header:
+            writer.writeheader()
+        
+        futures = [executor.submit(_run_single, filename, config, seed, generations)
+                   for filename, config, seed in pending]
+        for future in as_completed(futures):
+            run = future.result()
+            writer.writerow(run)
+            csvfile.flush()
+            runs.append(run)
+            print(f"{run['Instance']} | {run['Configuration']} | seed {run['Seed']}: "
+                  f"{run['Best Distance']:.2f} ({run['Elapsed Time (ms)']:.2f} ms)")
+    
+    return runs
+
+def summarize_runs(runs):
+    """Mean, standard deviation and best distance per (instance, configuration)"""
+    groups = {}
+    for run in runs:
+        groups.setdefault((run["Instance"], run["Configuration"]), []).append(run)
+    
+    summary = []
+    for (filename, name), group in groups.items():
+        distances = [run["Best Distance"] for run in group]
+        times = [run["Elapsed Time (ms)"] for run in group]
+        summary.append({
+            "Instance": filename,
+            "Configuration": name,
+            "Runs": len(group),
+            "Mean Distance": statistics.mean(distances),
+            "Stdev Distance": statistics.stdev(distances) if len(distances) > 1 else 0.0,
+            "Best Distance": min(distances),
+            "Mean Time (ms)": statistics.mean(times)
+        })
+    return summary
+
 def main():
-    # Load cities
-    cities = load_cities('tsp.csv')
-    print(f"Comparing GA configurations for {len(cities)} cities...")
+    # Parse command line arguments
+    parser = argparse.ArgumentParser(description='Compare GA parameter configurations')
+    parser.add_argument('--files', type=str, nargs='+', default=['tsp.csv'],
+                        help='CSV files with city coordinates')
+    parser.add_argument('--seeds', type=int, default=1, help='Random seeds per configuration')
+    parser.add_argument('--generations', type=int, default=100, help='Number of generations')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Worker processes (default: CPU count)')
+    parser.add_argument('--output', type=str, default='ga_comparison_runs.csv',
+                        help='Per-run CSV file (existing runs are resumed)')
+    args = parser.parse_args()
+    
+    print(f"Comparing GA configurations on {len(args.files)} instance(s)...")
     
     # Define configurations to compare
     configurations = [
@@ -112,33 +242,45 @@ def main():
     ]
     
     # Run experiments
-    results = run_experiment(cities, configurations, generations=100)
+    runs = run_sweep(configurations, args.files, range(args.seeds),
+                     generations=args.generations, output_file=args.output,
+                     workers=args.workers)
+    results = summarize_runs(runs)
     
     # Save results to CSV file
     with open('ga_comparison_results.csv', 'w', newline='') as csvfile:
-        fieldnames = ['Configuration', 'Best Distance', 'Elapsed Time (ms)']
+        fieldnames = ['Instance', 'Configuration', 'Runs', 'Mean Distance', 'Stdev Distance',
+                      'Best Distance', 'Mean Time (ms)']
         writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
         
         writer.writeheader()
         for result in results:
             writer.writerow({
+                'Instance': result['Instance'],
                 'Configuration': result['Configuration'],
+                'Runs': result['Runs'],
+                'Mean Distance': f"{result['Mean Distance']:.2f}",
+                'Stdev Distance': f"{result['Stdev Distance']:.2f}",
                 'Best Distance': f"{result['Best Distance']:.2f}",
-                'Elapsed Time (ms)': f"{result['Elapsed Time (ms)']:.2f}"
+                'Mean Time (ms)': f"{result['Mean Time (ms)']:.2f}"
             })
     
     # Print results summary
     print("\nResults Summary:")
-    print("Configuration, Best Distance, Elapsed Time (ms)")
+    print("Instance, Configuration, Runs, Mean Distance, Stdev Distance, Best Distance, Mean Time (ms)")
     for result in results:
-        print(f"{result['Configuration']}, {result['Best Distance']:.2f}, {result['Elapsed Time (ms)']:.2f}")
+        print(f"{result['Instance']}, {result['Configuration']}, {result['Runs']}, "
+              f"{result['Mean Distance']:.2f}, {result['Stdev Distance']:.2f}, "
+              f"{result['Best Distance']:.2f}, {result['Mean Time (ms)']:.2f}")
     
     # Also save results to text file for easy reading
     with open('ga_comparison_results.txt', 'w') as f:
         f.write("Results Summary:\n")
-        f.write("Configuration\tBest Distance\tElapsed Time (ms)\n")
+        f.write("Instance\tConfiguration\tRuns\tMean Distance\tStdev Distance\tBest Distance\tMean Time (ms)\n")
         for result in results:
-            f.write(f"{result['Configuration']}\t{result['Best Distance']:.2f}\t{result['Elapsed Time (ms)']:.2f}\n")
+            f.write(f"{result['Instance']}\t{result['Configuration']}\t{result['Runs']}\t"
+                    f"{result['Mean Distance']:.2f}\t{result['Stdev Distance']:.2f}\t"
+                    f"{result['Best Distance']:.2f}\t{result['Mean Time (ms)']:.2f}\n")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
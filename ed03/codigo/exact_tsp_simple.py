@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Exact TSP solvers: Held-Karp dynamic programming and branch-and-bound (simplified version)
+
+Both solvers fix the first city of the route, so rotations of the same tour
+are never considered, and neither of them materializes the set of all routes.
+"""
+from tsp_simple import DistanceMatrix, np
+
+# Largest number of unvisited-city sets whose MST bound is memoized
+MST_CACHE_SIZE = 1000000
+
+def _local_distances(cities, distance_matrix):
+    """City IDs and a distance table indexed by position in `cities`"""
+    if distance_matrix is None:
+        distance_matrix = DistanceMatrix(cities)
+    city_ids = [city[0] for city in cities]
+    dist = [[distance_matrix.distance(a, b) for b in city_ids] for a in city_ids]
+    return city_ids, dist
+
+def _held_karp_numpy(dist):
+    """Held-Karp over NumPy arrays, one vectorized step per (subset size, last city)"""
+    m = len(dist) - 1  # cities other than the fixed start
+    d = np.array(dist, dtype=np.float64)
+    full = 1 << m
+
+    # dp[mask, j]: shortest path from the start through `mask`, ending at city j + 1
+    dp = np.full((full, m), np.inf)
+    parent = np.full((full, m), -1, dtype=np.int8)
+    for j in range(m):
+        dp[1 << j, j] = d[0, j + 1]
+
+    masks = np.arange(full)
+    sizes = np.zeros(full, dtype=np.int8)
+    for bit in range(m):
+        sizes += (masks >> bit) & 1
+
+    for size in range(2, m + 1):
+        layer = masks[sizes == size]
+        for j in range(m):
+            with_j = layer[(layer >> j) & 1 == 1]
+            # Extend every path over mask - {j} ending at k by the edge k -> j
+            candidates = dp[with_j ^ (1 << j)] + d[1:, j + 1]
+            best = candidates.argmin(axis=1)
+            dp[with_j, j] = candidates[np.arange(len(with_j)), best]
+            parent[with_j, j] = best
+
+    closing = dp[full - 1] + d[1:, 0]
+    last = int(closing.argmin())
+    return float(closing[last]), lambda mask, j: int(parent[mask, j]), last
+
+def _held_karp_python(dist):
+    """Held-Karp with plain lists, used when NumPy is not installed"""
+    m = len(dist) - 1
+    full = 1 << m
+    inf = float('inf')
+
+    dp = [[inf] * m for _ in range(full)]
+    parent = [[-1] * m for _ in range(full)]
+    for j in range(m):
+        dp[1 << j][j] = dist[0][j + 1]
+
+    # Every proper subset of a mask is numerically smaller, so increasing order works
+    for mask in range(1, full):
+        row = dp[mask]
+        for j in range(m):
+            if not (mask >> j) & 1 or mask == 1 << j:
+                continue
+            previous = dp[mask ^ (1 << j)]
+            best, best_k = inf, -1
+            for k in range(m):
+                cost = previous[k] + dist[k + 1][j + 1]
+                if cost < best:
+                    best, best_k = cost, k
+            row[j] = best
+            parent[mask][j] = best_k
+
+    closing = [dp[full - 1][j] + dist[j + 1][0] for j in range(m)]
+    last = min(range(m), key=closing.__getitem__)
+    return closing[last], lambda mask, j: parent[mask][j], last
+
+def held_karp_tsp(cities, distance_matrix=None):
+    """Solve TSP exactly with Held-Karp dynamic programming, O(n^2 2^n)
+
+    Memory grows as n 2^n, which makes it practical up to about 20 cities.
+    """
+    city_ids, dist = _local_distances(cities, distance_matrix)
+    if len(city_ids) < 3:
+        return tuple(city_ids), sum(dist[i][i - 1] for i in range(len(city_ids)))
+
+    if np is not None:
+        length, parent, last = _held_karp_numpy(dist)
+    else:
+        length, parent, last = _held_karp_python(dist)
+
+    # Walk the parent table back from the full set
+    mask = (1 << (len(city_ids) - 1)) - 1
+    order = []
+    j = last
+    while j >= 0:
+        order.append(j + 1)
+        previous = parent(mask, j)
+        mask ^= 1 << j
+        j = previous
+    order.append(0)
+    order.reverse()
+
+    return tuple(city_ids[i] for i in order), length
+
+def _nearest_neighbor_tour(dist):
+    """Greedy tour from city 0, used as the initial upper bound"""
+    n = len(dist)
+    tour = [0]
+    remaining = set(range(1, n))
+    while remaining:
+        current = tour[-1]
+        nearest = min(remaining, key=dist[current].__getitem__)
+        tour.append(nearest)
+        remaining.remove(nearest)
+    length = sum(dist[tour[i - 1]][tour[i]] for i in range(n))
+    return tour, length
+
+def _mst_length(dist, nodes):
+    """Length of the minimum spanning tree over `nodes` (Prim's algorithm)"""
+    if len(nodes) < 2:
+        return 0
+    first = nodes[0]
+    best = {node: dist[first][node] for node in nodes[1:]}
+    total = 0
+    while best:
+        node = min(best, key=best.__getitem__)
+        total += best.pop(node)
+        row = dist[node]
+        for other in best:
+            if row[other] < best[other]:
+                best[other] = row[other]
+    return total
+
+def branch_and_bound_tsp(cities, distance_matrix=None):
+    """Solve TSP exactly with depth-first branch-and-bound
+
+    The lower bound of a partial route is its length plus the minimum spanning
+    tree of the unvisited cities plus the cheapest edges joining that tree to
+    the current city and back to the start. The search starts from the nearest
+    neighbour tour and tours are only explored in one direction (the second
+    city always comes before the third), so reflections are skipped too.
+    """
+    city_ids, dist = _local_distances(cities, distance_matrix)
+    n = len(city_ids)
+    if n < 4:
+        return held_karp_tsp(cities, distance_matrix)
+
+    best_tour, best_length = _nearest_neighbor_tour(dist)
+    mst_cache = {}
+    path = [0]
+
+    def search(current, remaining, cost):
+        nonlocal best_tour, best_length
+
+        if not remaining:
+            total = cost + dist[current][0]
+            if total < best_length:
+                best_length = total
+                best_tour = path.copy()
+            return
+
+        # MST part of the bound depends only on the unvisited set
+        key = frozenset(remaining)
+        mst = mst_cache.get(key)
+        if mst is None:
+            mst = _mst_length(dist, list(remaining))
+            if len(mst_cache) < MST_CACHE_SIZE:
+                mst_cache[key] = mst
+        row = dist[current]
+        bound = (cost + mst + min(row[city] for city in remaining)
+                 + min(dist[city][0] for city in remaining))
+        if bound >= best_length:
+            return
+
+        # Try the nearest cities first to find good tours early
+        for city in sorted(remaining, key=row.__getitem__):
+            if city == 2 and 1 in remaining:
+                continue
+            path.append(city)
+            remaining.remove(city)
+            search(city, remaining, cost + row[city])
+            remaining.add(city)
+            path.pop()
+
+    search(0, set(range(1, n)), 0)
+    return tuple(city_ids[i] for i in best_tour), best_length
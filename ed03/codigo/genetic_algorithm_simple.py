@@ -3,13 +3,35 @@
 Genetic Algorithm implementation for TSP (simplified version)
 """
 import random
-from tsp_simple import total_distance
+import bisect
+import itertools
+from tsp_simple import DistanceMatrix, total_distance, np
+from local_search_simple import two_opt, or_opt
+
+def spawn_seeds(seed, count):
+    """Independent child seeds, one per worker/island/run
+    
+    With NumPy these are SeedSequence children (seed may itself be a
+    SeedSequence); without it, integers drawn from a generator seeded with seed.
+    """
+    if np is not None:
+        if not isinstance(seed, np.random.SeedSequence):
+            seed = np.random.SeedSequence(seed)
+        return seed.spawn(count)
+    parent = random.Random(seed)
+    return [parent.getrandbits(64) for _ in range(count)]
 
 class GeneticAlgorithm:
     def __init__(self, cities, pop_size=100, elite_size=20, mutation_rate=0.1, 
                  crossover_rate=0.8, tournament_size=5, selection_method='tournament',
-                 crossover_method='pmx'):
+                 crossover_method='pmx', distance_matrix=None, evaluation='loop',
+                 representation='list', local_search=None, ls_budget=None, ls_neighbors=8,
+                 seed=None, rng=None):
+        if representation == 'array' and np is None:
+            raise ImportError("representation='array' requires NumPy")
+        
         self.cities = cities
+        self.distances = distance_matrix if distance_matrix is not None else DistanceMatrix(cities)
         self.pop_size = pop_size
         self.elite_size = elite_size
         self.mutation_rate = mutation_rate
@@ -17,68 +39,232 @@ class GeneticAlgorithm:
         self.tournament_size = tournament_size
         self.selection_method = selection_method
         self.crossover_method = crossover_method
+        self.evaluation = evaluation
+        self.representation = representation
+        self.local_search = local_search
+        self.ls_budget = ls_budget
+        self.ls_neighbors = ls_neighbors
         self.city_ids = [city[0] for city in cities]
         
+        # Independent random streams, so runs are reproducible and safe to parallelize
+        self.seed_rng(seed, rng)
+        
+        # Position-inverse arrays are indexed by city ID
+        self._id_bound = max(self.city_ids) + 1
+        
+        # Last population scored and its (order, lengths), so it is never scored twice
+        self._ranked_population = None
+        self._ranking = None
+        
+        # Lengths already known for the population built by next_generation
+        # (None for routes that must be scored from scratch)
+        self._known_lengths = None
+        
+    def seed_rng(self, seed=None, rng=None):
+        """(Re)seed the algorithm's random streams
+        
+        self.rng is a NumPy Generator used for batched draws (None without
+        NumPy) and self.random a random.Random for scalar draws, seeded from it.
+        `rng` may be an existing Generator; otherwise one is created from
+        `seed` (an int, a SeedSequence or None for fresh entropy).
+        """
+        if np is not None:
+            self.rng = rng if rng is not None else np.random.default_rng(seed)
+            self.random = random.Random(int(self.rng.integers(2 ** 63)))
+        else:
+            self.rng = None
+            self.random = rng if rng is not None else random.Random(seed)
+    
+    def _cut_points(self, size, count=None):
+        """Two distinct sorted crossover points, or a list of `count` of them"""
+        if count is None:
+            return tuple(sorted(self.random.sample(range(size), 2)))
+        if self.rng is None:
+            return [tuple(sorted(self.random.sample(range(size), 2))) for _ in range(count)]
+        
+        first = self.rng.integers(0, size, count)
+        second = self.rng.integers(0, size - 1, count)
+        second += second >= first  # distinct from first
+        return list(zip(np.minimum(first, second).tolist(), np.maximum(first, second).tolist()))
+    
     def create_initial_population(self):
         """Create initial population of random routes"""
+        if self.representation == 'array':
+            # One contiguous (pop_size x n_cities) int32 array, a random permutation per row
+            city_ids = np.array(self.city_ids, dtype=np.int32)
+            permutations = np.argsort(self.rng.random((self.pop_size, len(city_ids))), axis=1)
+            return city_ids[permutations]
+        
         population = []
         for _ in range(self.pop_size):
             route = self.city_ids.copy()
-            random.shuffle(route)
+            self.random.shuffle(route)
             population.append(route)
         return population
     
     def calculate_fitness(self, route):
         """Calculate fitness of a route (inverse of distance)"""
-        dist = total_distance(route, self.cities)
+        dist = total_distance(route, self.distances)
         return 1 / dist if dist > 0 else float('inf')
     
+    def rank_population(self, population):
+        """Score all routes and return (order, lengths), best route first in order
+        
+        In 'batch' mode all tour lengths come from one vectorized gather over
+        the distance matrix and order is an argsort index. The result for the
+        last population is cached, so scoring the same population again is free.
+        """
+        if population is self._ranked_population:
+            return self._ranking
+        
+        if self._known_lengths is not None and self._known_lengths[0] is population:
+            # Only score the routes whose length was not carried over
+            lengths = list(self._known_lengths[1])
+            missing = [i for i, length in enumerate(lengths) if length is None]
+            for i, length in zip(missing, self.score_routes([population[i] for i in missing])):
+                lengths[i] = length
+            if np is not None and self.evaluation == 'batch':
+                lengths = np.array(lengths, dtype=np.float64)
+        else:
+            lengths = self.score_routes(population)
+        
+        if np is not None and self.evaluation == 'batch':
+            order = np.argsort(lengths, kind='stable')
+        else:
+            order = sorted(range(len(population)), key=lengths.__getitem__)
+        
+        self._ranked_population = population
+        self._ranking = (order, lengths)
+        return self._ranking
+    
+    def score_routes(self, routes):
+        """Tour length of every route, in one batch or one at a time"""
+        if not len(routes):
+            return []
+        if self.evaluation == 'batch':
+            return self.distances.population_lengths(routes)
+        return [total_distance(route, self.distances) for route in routes]
+    
     def evaluate_population(self, population):
         """Evaluate all routes in the population"""
+        order, lengths = self.rank_population(population)
         fitness_results = {}
-        for i, route in enumerate(population):
-            fitness_results[i] = self.calculate_fitness(route)
-        return {k: v for k, v in sorted(fitness_results.items(), key=lambda item: item[1], reverse=True)}
+        for i in order:
+            dist = lengths[i]
+            fitness_results[int(i)] = 1 / dist if dist > 0 else float('inf')
+        return fitness_results
     
     def select_parents(self, fitness_results):
-        """Select parents for crossover"""
+        """Select parents for crossover
+        
+        fitness_results maps population index to fitness, best route first.
+        Available engines: 'tournament', 'vector_tournament', 'roulette',
+        'sus' (stochastic universal sampling) and 'alias' (Walker alias method).
+        """
+        engines = {
+            'tournament': self.tournament_selection,
+            'vector_tournament': self.vector_tournament_selection,
+            'roulette': self.roulette_selection,
+            'sus': self.sus_selection,
+            'alias': self.alias_selection
+        }
+        # Unknown names fall back to roulette, as before
+        engine = engines.get(self.selection_method, self.roulette_selection)
+        return engine(list(fitness_results.keys()), list(fitness_results.values()))
+    
+    def tournament_selection(self, indices, fitness):
+        """Tournament selection, each tournament drawn without replacement"""
+        # indices are ordered best first, so the smallest rank wins a tournament
+        ranks = range(len(indices))
+        return [indices[min(self.random.sample(ranks, self.tournament_size))]
+                for _ in range(len(indices))]
+    
+    def vector_tournament_selection(self, indices, fitness):
+        """Tournament selection with every tournament drawn in one NumPy call
+        
+        Contestants are drawn with replacement.
+        """
+        size = len(indices)
+        if self.rng is None:
+            return [indices[min(self.random.randrange(size) for _ in range(self.tournament_size))]
+                    for _ in range(size)]
+        
+        ranks = self.rng.integers(0, size, (size, self.tournament_size))
+        return np.asarray(indices)[ranks.min(axis=1)].tolist()
+    
+    def roulette_selection(self, indices, fitness):
+        """Roulette wheel selection by bisecting the prefix sums, O(n log n)"""
+        cumulative = list(itertools.accumulate(fitness))
+        fitness_sum = cumulative[-1]
+        last = len(indices) - 1
+        return [indices[min(bisect.bisect_right(cumulative, self.random.random() * fitness_sum), last)]
+                for _ in range(len(indices))]
+    
+    def sus_selection(self, indices, fitness):
+        """Stochastic universal sampling: one spin, evenly spaced pointers, O(n)"""
+        size = len(indices)
+        step = sum(fitness) / size
+        pointer = self.random.random() * step
+        
         selection_results = []
+        current = 0
+        for index, value in zip(indices, fitness):
+            current += value
+            while pointer < current and len(selection_results) < size:
+                selection_results.append(index)
+                pointer += step
+        # Rounding can leave the last pointer just past the end
+        while len(selection_results) < size:
+            selection_results.append(indices[-1])
         
-        if self.selection_method == 'tournament':
-            # Tournament selection
-            for _ in range(len(fitness_results)):
-                tournament = random.sample(list(fitness_results.keys()), self.tournament_size)
-                best_in_tournament = min(tournament, key=lambda x: -fitness_results[x])
-                selection_results.append(best_in_tournament)
-        else:
-            # Roulette wheel selection
-            fitness_sum = sum(fitness_results.values())
-            probabilities = [fitness / fitness_sum for fitness in fitness_results.values()]
-            indices = list(fitness_results.keys())
-            
-            # Simple roulette wheel implementation
-            for _ in range(len(fitness_results)):
-                pick = random.random() * fitness_sum
-                current = 0
-                for i, key in enumerate(fitness_results.keys()):
-                    current += fitness_results[key]
-                    if current > pick:
-                        selection_results.append(key)
-                        break
-            
+        # Pointers visit the routes best first, shuffle so elites are not all copies of one route
+        self.random.shuffle(selection_results)
         return selection_results
     
+    def alias_selection(self, indices, fitness):
+        """Roulette-equivalent sampling with Walker's alias method, O(1) per pick"""
+        size = len(indices)
+        fitness_sum = sum(fitness)
+        scaled = [value * size / fitness_sum for value in fitness]
+        
+        # Build the probability and alias tables
+        probability = [1.0] * size
+        alias = list(range(size))
+        small = [i for i, value in enumerate(scaled) if value < 1]
+        large = [i for i, value in enumerate(scaled) if value >= 1]
+        while small and large:
+            low, high = small.pop(), large.pop()
+            probability[low] = scaled[low]
+            alias[low] = high
+            scaled[high] -= 1 - scaled[low]
+            if scaled[high] < 1:
+                small.append(high)
+            else:
+                large.append(high)
+        
+        if self.rng is None:
+            picks = []
+            for _ in range(size):
+                column = self.random.randrange(size)
+                picks.append(column if self.random.random() < probability[column] else alias[column])
+        else:
+            columns = self.rng.integers(0, size, size)
+            keep = self.rng.random(size) < np.asarray(probability)[columns]
+            picks = np.where(keep, columns, np.asarray(alias)[columns]).tolist()
+        
+        return [indices[pick] for pick in picks]
+    
     def create_mating_pool(self, population, selection_results):
         """Create mating pool from selected parents"""
         mating_pool = [population[i] for i in selection_results]
         return mating_pool
     
-    def pmx_crossover(self, parent1, parent2):
+    def pmx_crossover(self, parent1, parent2, points=None):
         """Partially Mapped Crossover (PMX)"""
         size = len(parent1)
         
         # Choose crossover points
-        start, end = sorted(random.sample(range(size), 2))
+        start, end = points if points is not None else self._cut_points(size)
         
         # Create children with parent values
         child1 = [None] * size
@@ -111,12 +297,12 @@ class GeneticAlgorithm:
                 
         return child1, child2
     
-    def order_crossover(self, parent1, parent2):
+    def order_crossover(self, parent1, parent2, points=None):
         """Order Crossover (OX)"""
         size = len(parent1)
         
         # Choose crossover points
-        start, end = sorted(random.sample(range(size), 2))
+        start, end = points if points is not None else self._cut_points(size)
         
         # Create children
         child1 = [None] * size
@@ -175,60 +361,250 @@ class GeneticAlgorithm:
         
         return child1, child2
     
+    def _positions(self, route):
+        """Position-inverse array of a route: positions[city_id] = index in route"""
+        positions = np.empty(self._id_bound, dtype=np.int32)
+        positions[route] = np.arange(len(route), dtype=np.int32)
+        return positions
+    
+    def _segment_mask(self, route, start, end):
+        """Boolean array indexed by city ID, True for cities in route[start:end+1]"""
+        mask = np.zeros(self._id_bound, dtype=bool)
+        mask[route[start:end+1]] = True
+        return mask
+    
+    def _pmx_child(self, donor, other, start, end):
+        """Build one PMX child in O(n) using the donor's position-inverse array"""
+        child = other.copy()
+        child[start:end+1] = donor[start:end+1]
+        
+        in_segment = self._segment_mask(donor, start, end)
+        outside = np.ones(len(donor), dtype=bool)
+        outside[start:end+1] = False
+        
+        # Only positions outside the segment whose city was copied in need mapping
+        conflicts = np.flatnonzero(outside & in_segment[other])
+        if conflicts.size:
+            other_list = other.tolist()
+            positions = self._positions(donor).tolist()
+            in_segment = in_segment.tolist()
+            for i in conflicts.tolist():
+                city = other_list[i]
+                while in_segment[city]:
+                    city = other_list[positions[city]]
+                child[i] = city
+        
+        return child
+    
+    def pmx_crossover_array(self, parent1, parent2, points=None):
+        """Partially Mapped Crossover (PMX) on int32 array routes, O(n) per child"""
+        start, end = points if points is not None else self._cut_points(len(parent1))
+        return (self._pmx_child(parent1, parent2, start, end),
+                self._pmx_child(parent2, parent1, start, end))
+    
+    def order_crossover_array(self, parent1, parent2, points=None):
+        """Order Crossover (OX) on int32 array routes, O(n) per child"""
+        size = len(parent1)
+        start, end = points if points is not None else self._cut_points(size)
+        
+        outside = np.ones(size, dtype=bool)
+        outside[start:end+1] = False
+        
+        children = []
+        for donor, other in [(parent1, parent2), (parent2, parent1)]:
+            child = np.empty_like(donor)
+            child[start:end+1] = donor[start:end+1]
+            # Fill remaining positions in order from the other parent
+            in_segment = self._segment_mask(donor, start, end)
+            child[outside] = other[~in_segment[other]]
+            children.append(child)
+        
+        return children[0], children[1]
+    
+    def cycle_crossover_array(self, parent1, parent2):
+        """Cycle Crossover (CX) on int32 array routes, O(n)
+        
+        Alternate cycles are taken from parent1 and parent2.
+        """
+        size = len(parent1)
+        parent2_list = parent2.tolist()
+        positions = self._positions(parent1).tolist()
+        
+        # Label every position with the index of the cycle it belongs to
+        labels = [-1] * size
+        cycle = 0
+        for i in range(size):
+            if labels[i] < 0:
+                j = i
+                while labels[j] < 0:
+                    labels[j] = cycle
+                    j = positions[parent2_list[j]]
+                cycle += 1
+        
+        odd = np.array(labels) % 2 == 1
+        return np.where(odd, parent2, parent1), np.where(odd, parent1, parent2)
+    
     def crossover(self, parent1, parent2):
         """Perform crossover based on selected method"""
-        if random.random() > self.crossover_rate:
+        if self.random.random() > self.crossover_rate:
             # Skip crossover
             return parent1.copy(), parent2.copy()
+        
+        return self.recombine(parent1, parent2)
+    
+    def recombine(self, parent1, parent2, points=None):
+        """Apply the selected crossover operator (points: pre-drawn cut points)"""
+        if self.representation == 'array':
+            if self.crossover_method == 'order':
+                return self.order_crossover_array(parent1, parent2, points)
+            elif self.crossover_method == 'cycle':
+                return self.cycle_crossover_array(parent1, parent2)
+            return self.pmx_crossover_array(parent1, parent2, points)
             
         if self.crossover_method == 'pmx':
-            return self.pmx_crossover(parent1, parent2)
+            return self.pmx_crossover(parent1, parent2, points)
         elif self.crossover_method == 'order':
-            return self.order_crossover(parent1, parent2)
+            return self.order_crossover(parent1, parent2, points)
         elif self.crossover_method == 'cycle':
             return self.cycle_crossover(parent1, parent2)
         else:
             # Default to PMX
-            return self.pmx_crossover(parent1, parent2)
+            return self.pmx_crossover(parent1, parent2, points)
     
-    def breed_population(self, mating_pool):
-        """Breed a new population through crossover"""
+    def breed_population(self, mating_pool, pool_lengths=None):
+        """Breed a new population through crossover
+        
+        Returns the children and their lengths where they are known without
+        scoring: elites and skipped crossovers keep their parent's length,
+        crossover children get None.
+        """
+        if pool_lengths is None:
+            pool_lengths = [None] * len(mating_pool)
         children = []
+        lengths = []
         
         # Add elite routes directly
         for i in range(self.elite_size):
             children.append(mating_pool[i])
+            lengths.append(pool_lengths[i])
+        
+        # Draw parents, crossover decisions and cut points for all children at once
+        count = self.pop_size - self.elite_size
+        pool_size = len(mating_pool)
+        if self.rng is not None:
+            first = self.rng.integers(0, pool_size, count)
+            second = self.rng.integers(0, pool_size - 1, count)
+            second += second >= first  # distinct from first
+            skip = self.rng.random(count) > self.crossover_rate
+            draws = zip(first.tolist(), second.tolist(), skip.tolist())
+        else:
+            draws = [(*self.random.sample(range(pool_size), 2),
+                      self.random.random() > self.crossover_rate) for _ in range(count)]
+        points = self._cut_points(len(mating_pool[0]), count)
         
         # Perform crossover for rest of population
-        for i in range(self.pop_size - self.elite_size):
-            parent1, parent2 = random.sample(mating_pool, 2)
-            child1, _ = self.crossover(parent1, parent2)
-            children.append(child1)
+        for (a, b, skip), cut_points in zip(draws, points):
+            if skip:
+                # Skip crossover
+                children.append(mating_pool[a].copy())
+                lengths.append(pool_lengths[a])
+            else:
+                child1, _ = self.recombine(mating_pool[a], mating_pool[b], cut_points)
+                children.append(child1)
+                lengths.append(None)
             
-        return children
+        return children, lengths
+    
+    def swap_delta(self, route, i, j):
+        """Change in tour length caused by swapping positions i and j
+        
+        Only the (at most four) edges touching the two positions change, so
+        this is O(1). The route is left swapped.
+        """
+        rows = self.distances.rows
+        size = len(route)
+        edges = {(i - 1) % size, i, (j - 1) % size, j}  # edge k joins positions k and k + 1
+        
+        before = 0
+        for k in edges:
+            before += rows[route[k] - 1][route[(k + 1) % size] - 1]
+        route[i], route[j] = route[j], route[i]
+        after = 0
+        for k in edges:
+            after += rows[route[k] - 1][route[(k + 1) % size] - 1]
+        return after - before
     
-    def mutate(self, route):
-        """Perform mutation (swap mutation)"""
-        for i in range(len(route)):
-            if random.random() < self.mutation_rate:
-                j = random.randint(0, len(route) - 1)
+    def mutate(self, route, length=None):
+        """Perform mutation (swap mutation)
+        
+        The mutation mask and swap partners are drawn in one batch. Returns the
+        route and its length, updated by an O(1) delta per swap when the length
+        before mutation is known.
+        """
+        size = len(route)
+        if self.rng is not None:
+            positions = np.flatnonzero(self.rng.random(size) < self.mutation_rate).tolist()
+            partners = self.rng.integers(0, size, len(positions)).tolist()
+        else:
+            positions = [i for i in range(size) if self.random.random() < self.mutation_rate]
+            partners = [self.random.randint(0, size - 1) for _ in positions]
+        
+        for i, j in zip(positions, partners):
+            if length is None:
                 route[i], route[j] = route[j], route[i]
-        return route
+            else:
+                length += self.swap_delta(route, i, j)
+        return route, length
     
-    def mutate_population(self, population):
-        """Apply mutation to entire population"""
+    def improve(self, route, length=None):
+        """Apply the configured local search (memetic step) to a route
+        
+        Returns the improved route and its length (None if it was unknown).
+        """
+        dist = self.distances.rows
+        neighbors = self.distances.nearest_neighbors(self.ls_neighbors)
+        tour = [city_id - 1 for city_id in route]
+        change = 0
+        
+        if self.local_search in ('2opt', '2opt+oropt'):
+            change += two_opt(tour, dist, neighbors, self.ls_budget)
+        if self.local_search in ('oropt', '2opt+oropt'):
+            change += or_opt(tour, dist, neighbors, self.ls_budget)
+        
+        if length is not None:
+            length += change
+        if self.representation == 'array':
+            return np.array(tour, dtype=np.int32) + 1, length
+        return [city_index + 1 for city_index in tour], length
+    
+    def mutate_population(self, population, lengths=None):
+        """Apply mutation to entire population
+        
+        Returns the mutated population and the lengths that could be kept up
+        to date incrementally (None where unknown).
+        """
+        if lengths is None:
+            lengths = [None] * len(population)
         mutated_pop = []
+        mutated_lengths = []
         
         # Preserve elite without mutation
         for i in range(self.elite_size):
             mutated_pop.append(population[i])
+            mutated_lengths.append(lengths[i])
         
         # Mutate the rest
         for i in range(self.elite_size, len(population)):
-            mutated_route = self.mutate(population[i].copy())
+            mutated_route, length = self.mutate(population[i].copy(), lengths[i])
+            if self.local_search:
+                mutated_route, length = self.improve(mutated_route, length)
             mutated_pop.append(mutated_route)
+            mutated_lengths.append(length)
+        
+        if self.representation == 'array':
+            return np.stack(mutated_pop), mutated_lengths
             
-        return mutated_pop
+        return mutated_pop, mutated_lengths
     
     def next_generation(self, current_pop):
         """Create the next generation"""
@@ -243,19 +619,28 @@ class GeneticAlgorithm:
         
         # Create mating pool
         mating_pool = self.create_mating_pool(current_pop, selection_results)
+        _, lengths = self.rank_population(current_pop)
+        pool_lengths = [lengths[i] for i in selection_results]
         
         # Breed population
-        children = self.breed_population(mating_pool)
+        children, child_lengths = self.breed_population(mating_pool, pool_lengths)
         
-        # Mutate population
-        next_gen = self.mutate_population(children)
+        # Mutate population (lengths are carried over so that only crossover
+        # children are scored from scratch)
+        next_gen, next_lengths = self.mutate_population(children, child_lengths)
+        self._known_lengths = (next_gen, next_lengths)
         
         return next_gen
     
-    def run(self, generations):
-        """Run the genetic algorithm"""
+    def run(self, generations, population=None, verbose=True):
+        """Run the genetic algorithm
+        
+        An existing population can be passed to continue evolving it; the
+        final population is kept in self.population.
+        """
         # Create initial population
-        population = self.create_initial_population()
+        if population is None:
+            population = self.create_initial_population()
         
         # Track best route
         best_distance = float('inf')
@@ -267,11 +652,12 @@ class GeneticAlgorithm:
             # Create next generation
             population = self.next_generation(population)
             
-            # Get best route in current generation
+            # Get best route in current generation (this scoring is cached and
+            # reused by next_generation on the following iteration)
             fitness_results = self.evaluate_population(population)
-            best_index = list(fitness_results.keys())[0]
+            best_index = next(iter(fitness_results))
             best_current_route = population[best_index]
-            best_current_distance = total_distance(best_current_route, self.cities)
+            best_current_distance = float(self.rank_population(population)[1][best_index])
             
             # Track average fitness
             avg_fitness = sum(fitness_results.values()) / len(fitness_results)
@@ -283,7 +669,12 @@ class GeneticAlgorithm:
                 best_route = best_current_route
             
             # Print progress
-            if gen % 10 == 0 or gen == generations - 1:
+            if verbose and (gen % 10 == 0 or gen == generations - 1):
                 print(f"Generation {gen}: Best distance = {best_current_distance:.2f}")
         
+        self.population = population
+        
+        if self.representation == 'array' and best_route is not None:
+            best_route = best_route.tolist()
+        
         return best_route, best_distance, fitness_history
\ No newline at end of file
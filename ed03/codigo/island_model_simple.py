@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Island model for the genetic algorithm: several sub-populations evolved in
+parallel on a process pool, exchanging their best routes every few generations
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from genetic_algorithm_simple import GeneticAlgorithm, spawn_seeds
+
+# Genetic algorithm of the current worker process, built once by _init_worker
+_worker_ga = None
+
+def _init_worker(ga_params):
+    """Build the worker's GeneticAlgorithm (and its distance matrix) once per process"""
+    global _worker_ga
+    _worker_ga = GeneticAlgorithm(**ga_params)
+
+def _evolve_island(population, generations, seed):
+    """Evolve one island for a number of generations inside a worker process"""
+    _worker_ga.seed_rng(seed)
+    
+    best_route, best_distance, fitness_history = _worker_ga.run(
+        generations, population=population, verbose=False)
+    population = _worker_ga.population
+    order, _ = _worker_ga.rank_population(population)
+    return population, [int(i) for i in order], best_route, best_distance, fitness_history
+
+class IslandModel:
+    def __init__(self, cities, islands=4, migration_interval=10, migration_size=2,
+                 topology='ring', workers=None, seed=None, **ga_params):
+        if topology not in ('ring', 'full'):
+            raise ValueError(f"Unknown topology: {topology}")
+        
+        self.islands = islands
+        self.migration_interval = migration_interval
+        self.migration_size = migration_size
+        self.topology = topology
+        self.workers = workers or min(islands, os.cpu_count() or 1)
+        self.seed = seed
+        self.ga_params = dict(ga_params, cities=cities)
+    
+    def neighbors(self, island):
+        """Islands that receive migrants from the given island"""
+        if self.topology == 'ring':
+            return [(island + 1) % self.islands] if self.islands > 1 else []
+        return [other for other in range(self.islands) if other != island]
+    
+    def migrate(self, populations, orders):
+        """Copy the top routes of each island over the worst routes of its neighbors"""
+        # Collect all migrants first so every island sends routes from the same epoch
+        incoming = [[] for _ in range(self.islands)]
+        for island in range(self.islands):
+            best = orders[island][:self.migration_size]
+            for neighbor in self.neighbors(island):
+                incoming[neighbor].extend(populations[island][i].copy() for i in best)
+        
+        for island, migrants in enumerate(incoming):
+            # Replace from the worst route upwards, never touching the island's best
+            worst = orders[island][::-1][:len(orders[island]) - 1]
+            for index, route in zip(worst, migrants):
+                populations[island][index] = route
+    
+    def run(self, generations):
+        """Run all islands and return the best route over every island"""
+        populations = [None] * self.islands
+        best_distance = float('inf')
+        best_route = None
+        fitness_history = []
+        
+        # One independent stream per island and epoch, so results do not depend
+        # on which worker process evolves which island
+        epochs = -(-generations // self.migration_interval)
+        seeds = [spawn_seeds(island_seed, epochs)
+                 for island_seed in spawn_seeds(self.seed, self.islands)]
+        
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                 initargs=(self.ga_params,)) as executor:
+            done = 0
+            epoch_index = 0
+            while done < generations:
+                epoch = min(self.migration_interval, generations - done)
+                
+                # Evolve every island independently for one epoch
+                futures = [executor.submit(_evolve_island, populations[island], epoch,
+                                           seeds[island][epoch_index])
+                           for island in range(self.islands)]
+                results = [future.result() for future in futures]
+                
+                orders = []
+                for island, (population, order, route, distance, history) in enumerate(results):
+                    populations[island] = population
+                    orders.append(order)
+                    if distance < best_distance:
+                        best_distance = distance
+                        best_route = route
+                
+                # Average fitness over islands, generation by generation
+                for gen_fitness in zip(*(result[4] for result in results)):
+                    fitness_history.append(sum(gen_fitness) / len(gen_fitness))
+                
+                done += epoch
+                epoch_index += 1
+                print(f"Generation {done - 1}: Best distance = {best_distance:.2f}")
+                
+                if done < generations:
+                    self.migrate(populations, orders)
+        
+        return best_route, best_distance, fitness_history
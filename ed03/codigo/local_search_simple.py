@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Local search operators for TSP routes (2-opt and Or-opt) using candidate lists
+
+Routes here are lists of 0-based city indices (city_id - 1). Every candidate
+move is priced in O(1) from the edges it removes and adds; only moves that
+improve the route are applied.
+"""
+
+# Minimum improvement for a move to count, avoids cycling on rounding noise
+EPS = 1e-9
+
+def _positions(tour):
+    """Position of every city in the tour"""
+    positions = [0] * len(tour)
+    for i, city in enumerate(tour):
+        positions[city] = i
+    return positions
+
+def _reverse(tour, positions, i, j):
+    """2-opt move removing edges (tour[i], tour[i+1]) and (tour[j], tour[j+1])"""
+    if i < j:
+        lo, hi = i + 1, j
+    else:
+        # Reversing the complementary segment gives the same cyclic tour
+        lo, hi = j + 1, i
+    tour[lo:hi + 1] = tour[lo:hi + 1][::-1]
+    for k in range(lo, hi + 1):
+        positions[tour[k]] = k
+
+def _move_segment(tour, positions, i, length, insert_after, reverse):
+    """Or-opt move: put the `length` cities starting at position i right after `insert_after`
+
+    Only the cities between the segment and the insertion point are shifted,
+    on whichever side is shorter, and only their positions are updated.
+    """
+    n = len(tour)
+    segment = [tour[(i + k) % n] for k in range(length)]
+    if reverse:
+        segment.reverse()
+    p = positions[insert_after]
+    forward = (p - i - length + 1) % n  # cities after the segment, up to insert_after
+    backward = (i - 1 - p) % n          # cities between insert_after and the segment
+    
+    if forward <= backward:
+        # The cities after the segment move back into its place
+        for k in range(forward):
+            city = tour[(i + length + k) % n]
+            tour[(i + k) % n] = city
+            positions[city] = (i + k) % n
+        start = i + forward
+    else:
+        # The cities before the segment move forward, from the nearest one outwards
+        for k in range(backward):
+            city = tour[(i - 1 - k) % n]
+            tour[(i + length - 1 - k) % n] = city
+            positions[city] = (i + length - 1 - k) % n
+        start = p + 1
+    
+    for k, city in enumerate(segment):
+        tour[(start + k) % n] = city
+        positions[city] = (start + k) % n
+
+def two_opt(tour, dist, neighbors, budget=None):
+    """Improve a tour in place with 2-opt moves, return the total change in length
+
+    For each city a only cities c from its candidate list that are closer than
+    a's current neighbour are tried, as any improving move must add such an edge.
+    `budget` caps the number of moves applied (None runs to a local optimum).
+    """
+    n = len(tour)
+    if n < 5:
+        return 0
+    positions = _positions(tour)
+    moves = 0
+    change = 0
+    improved = True
+    
+    while improved:
+        improved = False
+        for a in range(n):
+            i = positions[a]
+            succ_a = tour[(i + 1) % n]
+            pred_a = tour[i - 1]
+            
+            for c in neighbors[a]:
+                d_ac = dist[a][c]
+                if d_ac >= dist[a][succ_a] and d_ac >= dist[pred_a][a]:
+                    break
+                j = positions[c]
+                
+                # Successor direction: (a, succ a) + (c, succ c) -> (a, c) + (succ a, succ c)
+                succ_c = tour[(j + 1) % n]
+                if c != succ_a and succ_c != a:
+                    delta = d_ac + dist[succ_a][succ_c] - dist[a][succ_a] - dist[c][succ_c]
+                    if delta < -EPS:
+                        _reverse(tour, positions, i, j)
+                        change += delta
+                        moves += 1
+                        improved = True
+                        break
+                
+                # Predecessor direction: (pred a, a) + (pred c, c) -> (a, c) + (pred a, pred c)
+                pred_c = tour[j - 1]
+                if c != pred_a and pred_c != a:
+                    delta = d_ac + dist[pred_a][pred_c] - dist[pred_a][a] - dist[pred_c][c]
+                    if delta < -EPS:
+                        _reverse(tour, positions, (i - 1) % n, (j - 1) % n)
+                        change += delta
+                        moves += 1
+                        improved = True
+                        break
+            
+            if budget is not None and moves >= budget:
+                return change
+    
+    return change
+
+def or_opt(tour, dist, neighbors, budget=None, max_segment=3):
+    """Improve a tour in place by moving segments of 1..max_segment cities
+
+    A segment is reinserted, forwards or reversed, next to one of the candidate
+    neighbours of its first city. Returns the total change in length.
+    """
+    n = len(tour)
+    if n < max_segment + 3:
+        return 0
+    positions = _positions(tour)
+    moves = 0
+    change = 0
+    improved = True
+    
+    while improved:
+        improved = False
+        for length in range(1, max_segment + 1):
+            i = 0
+            while i < n:
+                first, last = tour[i], tour[(i + length - 1) % n]
+                prev, after = tour[i - 1], tour[(i + length) % n]
+                removal_gain = dist[prev][first] + dist[last][after] - dist[prev][after]
+                best = None
+                
+                for c in neighbors[first]:
+                    if dist[first][c] >= removal_gain:
+                        break
+                    j = positions[c]
+                    if (j - i) % n < length:
+                        continue
+                    succ_c, pred_c = tour[(j + 1) % n], tour[j - 1]
+                    
+                    # c -> first ... last -> succ c
+                    if (positions[succ_c] - i) % n >= length:
+                        delta = (dist[c][first] + dist[last][succ_c] - dist[c][succ_c]
+                                 - removal_gain)
+                        if delta < -EPS:
+                            best = (delta, c, False)
+                            break
+                    # pred c -> last ... first -> c
+                    if (positions[pred_c] - i) % n >= length:
+                        delta = (dist[pred_c][last] + dist[first][c] - dist[pred_c][c]
+                                 - removal_gain)
+                        if delta < -EPS:
+                            best = (delta, pred_c, True)
+                            break
+                
+                if best is None:
+                    i += 1
+                    continue
+                
+                delta, insert_after, reverse = best
+                _move_segment(tour, positions, i, length, insert_after, reverse)
+                
+                change += delta
+                moves += 1
+                improved = True
+                if budget is not None and moves >= budget:
+                    return change
+    
+    return change
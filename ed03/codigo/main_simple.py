@@ -4,8 +4,9 @@ Main script to run genetic algorithm on TSP instances (simplified version withou
 """
 import time
 import argparse
-from tsp_simple import load_cities, calculate_distance
+from tsp_simple import load_cities, calculate_distance, DistanceMatrix
 from genetic_algorithm_simple import GeneticAlgorithm
+from island_model_simple import IslandModel
 
 def main():
     # Parse command line arguments
@@ -18,27 +19,67 @@ def main():
     parser.add_argument('--elite_size', type=int, default=50, help='Elite size')
     parser.add_argument('--tournament_size', type=int, default=10, help='Tournament size')
     parser.add_argument('--selection', type=str, default='tournament', 
-                        choices=['tournament', 'roulette'], help='Selection method')
+                        choices=['tournament', 'vector_tournament', 'roulette', 'sus', 'alias'],
+                        help='Selection method')
     parser.add_argument('--crossover', type=str, default='pmx', 
                         choices=['pmx', 'order', 'cycle'], help='Crossover method')
+    parser.add_argument('--evaluation', type=str, default='loop',
+                        choices=['loop', 'batch'], help='Fitness evaluation mode')
+    parser.add_argument('--representation', type=str, default='list',
+                        choices=['list', 'array'], help='Population representation')
+    parser.add_argument('--local_search', type=str, default=None,
+                        choices=['2opt', 'oropt', '2opt+oropt'], help='Local search applied to offspring')
+    parser.add_argument('--ls_budget', type=int, default=None,
+                        help='Maximum improving moves per route and operator (default: until local optimum)')
+    parser.add_argument('--seed', type=int, default=None, help='Random seed (default: nondeterministic)')
+    parser.add_argument('--islands', type=int, default=1,
+                        help='Number of islands evolved in parallel (1 = single population)')
+    parser.add_argument('--migration_interval', '--migration-interval', type=int, default=10,
+                        help='Generations between migrations')
+    parser.add_argument('--migration_size', '--migration-size', type=int, default=2,
+                        help='Routes sent by each island per migration')
+    parser.add_argument('--topology', type=str, default='ring',
+                        choices=['ring', 'full'], help='Migration topology')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Worker processes for the island model (default: one per island, up to CPU count)')
     args = parser.parse_args()
     
     # Load cities from CSV file
     cities = load_cities(args.file)
     print(f"Solving TSP for {len(cities)} cities...")
     
-    # Initialize genetic algorithm
-    ga = GeneticAlgorithm(
-        cities=cities,
+    # Precompute pairwise distances once for the whole run
+    distance_matrix = DistanceMatrix(cities)
+    
+    ga_params = dict(
         pop_size=args.pop_size,
         elite_size=args.elite_size,
         mutation_rate=args.mutation_rate,
         crossover_rate=args.crossover_rate,
         tournament_size=args.tournament_size,
         selection_method=args.selection,
-        crossover_method=args.crossover
+        crossover_method=args.crossover,
+        evaluation=args.evaluation,
+        representation=args.representation,
+        local_search=args.local_search,
+        ls_budget=args.ls_budget,
+        seed=args.seed
     )
     
+    # Initialize genetic algorithm (or one per island, built inside the worker processes)
+    if args.islands > 1:
+        ga = IslandModel(
+            cities=cities,
+            islands=args.islands,
+            migration_interval=args.migration_interval,
+            migration_size=args.migration_size,
+            topology=args.topology,
+            workers=args.workers,
+            **ga_params
+        )
+    else:
+        ga = GeneticAlgorithm(cities=cities, distance_matrix=distance_matrix, **ga_params)
+    
     # Record start time
     start_time = time.time()
     
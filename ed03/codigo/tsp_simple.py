@@ -5,6 +5,15 @@ TSP utility functions (simplified version without pandas)
 import math
 import csv
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, fall back to pure Python
+    np = None
+
+# Largest instance for which the NumPy matrix also gets a nested-list copy
+# (see DistanceMatrix.rows); the copy takes about four times the array's memory
+ROWS_MAX_SIZE = 1000
+
 def load_cities(filename):
     """Load cities from CSV file without using pandas"""
     cities = []
@@ -23,8 +32,104 @@ def calculate_distance(city1, city2):
     _, x2, y2 = city2
     return math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
 
+class DistanceMatrix:
+    """Pairwise distances between cities, computed once from load_cities output.
+
+    Rows and columns are indexed by city_id - 1, the same convention used by
+    total_distance. Uses a NumPy float64 N x N array when NumPy is installed
+    and a list of lists otherwise.
+    """
+
+    def __init__(self, cities, use_numpy=True):
+        self.cities = cities
+        self.size = len(cities)
+        self._neighbor_lists = {}
+
+        if use_numpy and np is not None:
+            xs = np.array([x for _, x, _ in cities], dtype=np.float64)
+            ys = np.array([y for _, _, y in cities], dtype=np.float64)
+            # Row by row, so the only N x N allocation is the result itself
+            self.array = np.empty((self.size, self.size), dtype=np.float64)
+            for i in range(self.size):
+                np.hypot(xs - xs[i], ys - ys[i], out=self.array[i])
+            self._rows = None
+        else:
+            self.array = None
+            self._rows = [[calculate_distance(city1, city2) for city2 in cities]
+                          for city1 in cities]
+
+    def __len__(self):
+        return self.size
+
+    @property
+    def rows(self):
+        """Distances indexable as rows[i][j], the fastest form for scalar lookups
+
+        With NumPy, a list-of-lists copy of the array is built on first use for
+        instances up to ROWS_MAX_SIZE cities; larger instances get the array
+        itself, which supports the same indexing without the extra memory.
+        """
+        if self._rows is None:
+            if self.size > ROWS_MAX_SIZE:
+                return self.array
+            self._rows = self.array.tolist()
+        return self._rows
+
+    def distance(self, city_id1, city_id2):
+        """Distance between two cities given by their IDs"""
+        return self.rows[city_id1 - 1][city_id2 - 1]
+
+    def tour_length(self, route):
+        """Length of a closed tour given as a sequence of city IDs"""
+        # For short routes converting to an array costs more than the plain loop
+        if self.array is not None and len(route) > 64:
+            # Gather all edges at once: (route[i], route[i + 1]) and the closing edge
+            indices = np.asarray(route) - 1
+            return float(self.array[indices, np.roll(indices, -1)].sum())
+
+        rows = self.rows
+        previous = route[-1] - 1
+        distance = 0
+        for city_id in route:
+            current = city_id - 1
+            distance += rows[previous][current]
+            previous = current
+        return distance
+
+    def nearest_neighbors(self, k):
+        """Candidate lists: for each city index, the indices of its k nearest cities"""
+        k = min(k, self.size - 1)
+        if k not in self._neighbor_lists:
+            if self.array is not None:
+                order = np.argsort(self.array, axis=1, kind='stable')
+                neighbors = [[j for j in row if j != i][:k] for i, row in enumerate(order[:, :k + 1].tolist())]
+            else:
+                neighbors = [sorted((j for j in range(self.size) if j != i), key=row.__getitem__)[:k]
+                             for i, row in enumerate(self.rows)]
+            self._neighbor_lists[k] = neighbors
+        return self._neighbor_lists[k]
+
+    def population_lengths(self, population):
+        """Lengths of all tours in a population
+
+        With NumPy the population is packed into a 2-D (pop_size x n_cities)
+        integer array and every tour is scored in a single gather; the result
+        is a float64 array. Without NumPy a list is returned.
+        """
+        if self.array is None:
+            return [self.tour_length(route) for route in population]
+
+        indices = np.asarray(population) - 1
+        return self.array[indices, np.roll(indices, -1, axis=1)].sum(axis=1)
+
 def total_distance(route, cities):
-    """Calculate total distance of a route"""
+    """Calculate total distance of a route
+
+    `cities` may be the list returned by load_cities or a DistanceMatrix.
+    """
+    if isinstance(cities, DistanceMatrix):
+        return cities.tour_length(route)
+
     distance = 0
     for i in range(len(route) - 1):
         city1 = cities[route[i] - 1]  # Adjust index if city IDs start from 1
@@ -36,4 +141,4 @@ def total_distance(route, cities):
     city2 = cities[route[0] - 1]
     distance += calculate_distance(city1, city2)
     
-    return distance
\ No newline at end of file
+    return distance